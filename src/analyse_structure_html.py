@@ -1,52 +1,98 @@
 import re
 import csv
+import json
 import os
 import sys
+import glob
 import argparse
 import logging
-import nltk
-from bs4 import BeautifulSoup
 from collections import Counter
-from nltk.util import ngrams
-from nltk.corpus import stopwords
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from html import unescape
 from typing import Dict, Any, List
 from urllib.parse import urljoin, urlparse
 
+# Numba (optionnel) pour accélérer le comptage des n-grams
+try:
+    import numpy as np
+    from numba import njit, types
+    from numba.typed import Dict as NumbaDict
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# selectolax (optionnel) : parseur HTML en C, beaucoup plus rapide que bs4
+try:
+    try:
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    except ImportError:
+        # anciennes versions de selectolax : backend Modest uniquement
+        from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# lxml (optionnel) : parse le fichier en flux, sans charger tout le HTML en mémoire
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 
 def ensure_nltk_resources():
     """S'assure que les ressources NLTK nécessaires sont présentes.
-    Tente de télécharger `stopwords` et `punkt` si manquants.
+    Tente de télécharger `stopwords` si manquant.
     Silence les erreurs réseau et continue avec des valeurs par défaut minimales.
     """
+    try:
+        import nltk
+        from nltk.corpus import stopwords
+    except ImportError:
+        logging.warning("NLTK indisponible; utilisation d'une liste minimale de stopwords.")
+        return
     try:
         stopwords.words('french')
     except LookupError:
         try:
-            nltk.download('stopwords')
+            if nltk.download('stopwords'):
+                _reload_stopwords()
         except Exception:
             logging.warning("Impossible de télécharger 'stopwords' NLTK; utilisation d'une liste minimale.")
 
+
+def _load_french_stopwords():
+    # lecture locale uniquement : le téléchargement est fait par ensure_nltk_resources()
     try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        try:
-            nltk.download('punkt')
-        except Exception:
-            logging.warning("Impossible de télécharger 'punkt' NLTK; segmentation simple utilisée.")
+        from nltk.corpus import stopwords
+        return set(stopwords.words('french'))
+    except Exception:
+        # Liste minimale si NLTK indisponible
+        return set()
 
 
-ensure_nltk_resources()
+def _reload_stopwords():
+    """(Re)charge les stopwords : au premier besoin et après un téléchargement NLTK."""
+    global STOPWORDS, STOPWORDS_EXTENDED
+    STOPWORDS = _load_french_stopwords()
+    STOPWORDS_EXTENDED = frozenset(STOPWORDS | _EXTRA_STOPWORDS)
+    return STOPWORDS_EXTENDED
 
 
-try:
-    STOPWORDS = set(stopwords.words('french'))
-except Exception:
-    # Liste minimale si NLTK indisponible
-    STOPWORDS = set([])
+def _stopwords_extended():
+    """Stopwords étendus, chargés depuis NLTK au premier appel seulement."""
+    if STOPWORDS_EXTENDED is None:
+        return _reload_stopwords()
+    return STOPWORDS_EXTENDED
+
+
+# NLTK n'est importé qu'au premier besoin (voir _stopwords_extended)
+STOPWORDS = None
 
 # Stopwords étendus français pour filtrer les mots non significatifs
 # Inclut pronoms, démonstratifs, conjonctions, prépositions communes
-STOPWORDS_EXTENDED = STOPWORDS.union({
+_EXTRA_STOPWORDS = frozenset({
     # Pronoms
     "je", "tu", "il", "elle", "nous", "vous", "ils", "elles", "on", "moi", "toi", "lui", "nous", "vous", "eux",
     # Démonstratifs
@@ -71,45 +117,255 @@ STOPWORDS_EXTENDED = STOPWORDS.union({
     # Autres mots peu significatifs
     "même", "autre", "tel", "telle", "tel", "etc", "même", "autant", "aussi", "seulement", "surtout",
     "quelque", "quelques", "quelqu'un", "aucun", "aucune", "nul", "nulle", "tout", "tous", "toute", "toutes"
-}) 
+})
+STOPWORDS_EXTENDED = None
 
 
 ########################################
 # 1. Extraction du texte visible
 ########################################
+# balises dont le contenu n'est pas considéré comme visible (scripts, styles, menus, footers, forms)
+_HIDDEN_TAGS = ("script", "style", "nav", "footer", "form", "noscript")
+# balises collectées en un seul parcours du DOM (titres + liens)
+_WALK_TAGS = ("h1", "h2", "h3", "a")
+_WALK_SELECTOR = ", ".join(_WALK_TAGS)
+_WS_RE = re.compile(r"\s+")
+
+
 def get_visible_text(soup):
     # supprimer scripts, styles, menus, footers, forms
-    for tag in soup(["script", "style", "nav", "footer", "form", "noscript"]):
+    for tag in soup(list(_HIDDEN_TAGS)):
         tag.decompose()
 
     # texte brut
     text = soup.get_text(separator=" ")
 
     # nettoyage
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 
+# version regex (sans DOM) de get_visible_text
+# un commentaire jamais fermé va jusqu'à la fin du document (comme dans le DOM) : un seul balayage
+_COMMENT_RE = re.compile(r"<!--.*?(?:-->|\Z)", re.S)
+# balises ouvrantes/fermantes de `_HIDDEN_TAGS`, appariées par `_hidden_block_spans`
+_HIDDEN_TOKEN_RE = re.compile(r"<(/?)(%s)\b[^>]*>" % "|".join(_HIDDEN_TAGS), re.I)
+# contenu brut : aucune balise n'y est interprétée, on saute directement à la fermeture
+_RAW_TEXT_CLOSE_RE = {name: re.compile(r"</%s\s*>" % name, re.I) for name in ("script", "style")}
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _hidden_block_spans(html):
+    """Intervalles (début, fin) des blocs `_HIDDEN_TAGS` du HTML brut, en un passage linéaire.
+    Les blocs imbriqués sont appariés avec une pile ; un bloc jamais fermé n'est pas retiré.
+    """
+    spans = []
+    stack = []  # (nom, début) des blocs ouverts
+    open_count = Counter()
+    no_close_from = {}  # nom brut -> position après laquelle aucune fermeture n'existe
+    pos = 0
+    while True:
+        m = _HIDDEN_TOKEN_RE.search(html, pos)
+        if m is None:
+            break
+        pos = m.end()
+        name = m.group(2).lower()
+        if m.group(1):
+            # fermeture : dépile jusqu'au dernier bloc de même nom (fermeture orpheline ignorée)
+            if open_count[name]:
+                while True:
+                    open_name, start = stack.pop()
+                    open_count[open_name] -= 1
+                    if open_name == name:
+                        break
+                spans.append((start, m.end()))
+        elif name in _RAW_TEXT_CLOSE_RE:
+            if no_close_from.get(name, len(html) + 1) <= m.start():
+                continue
+            close = _RAW_TEXT_CLOSE_RE[name].search(html, pos)
+            if close is None:
+                no_close_from[name] = m.start()
+                continue
+            spans.append((m.start(), close.end()))
+            pos = close.end()
+        else:
+            stack.append((name, m.start()))
+            open_count[name] += 1
+    return spans
+
+
+def get_visible_text_fast(html):
+    """Équivalent approché de `get_visible_text` directement sur le HTML brut.
+    Évite la construction du DOM, mais reste approximatif sur du HTML mal formé :
+    un bloc masqué (nav, form...) jamais fermé reste visible, alors que le DOM le
+    prolongerait jusqu'à la fermeture de son parent. Coût linéaire dans tous les cas.
+    """
+    text = _COMMENT_RE.sub(" ", html or "")
+    parts = []
+    last = 0
+    # blocs triés par début : un bloc inclus dans le précédent retiré est déjà couvert
+    for start, end in sorted(_hidden_block_spans(text)):
+        if start < last:
+            last = max(last, end)
+            continue
+        parts.append(text[last:start])
+        last = end
+    parts.append(text[last:])
+    text = _TAG_RE.sub(" ", " ".join(parts))
+    return _WS_RE.sub(" ", unescape(text)).strip()
+
+
 ########################################
 # 2. Extraction des n‑grams
 ########################################
-def extract_ngrams(text, n_min=1, n_max=5):
-    text = (text or "").lower()
-    # autoriser chiffres et apostrophes dans les mots
-    words = [w for w in re.findall(r"[0-9a-zA-Zàâçéèêëîïôûùüÿñæœ''-]+", text)
-             if w and w.lower() not in STOPWORDS_EXTENDED and len(w) > 2]
+# mots du texte (déjà en minuscules) : chiffres, lettres accentuées, apostrophes et tirets
+_WORD_CHARS = r"[0-9a-zàâçéèêëîïôûùüÿñæœ'-]"
+# mots d'au moins 3 caractères : le filtre de longueur des n-grams est fait par la regex
+_CONTENT_WORD_RE = re.compile(_WORD_CHARS + "{3,}")
+# fin de phrase : ponctuation forte suivie d'une majuscule
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-ZÀ-Ý])")
+
+# plus grand code de fenêtre représentable sans collision sur int64
+_MAX_NGRAM_CODE = 2 ** 63 - 1
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _ngram_counts(ids, n, base):
+        """Compte les fenêtres de `n` identifiants consécutifs.
+        Chaque fenêtre est codée exactement en base `base` (pas de collision).
+        Retourne (indice de première occurrence, nombre d'occurrences) par fenêtre,
+        dans l'ordre de première apparition.
+        """
+        counts = NumbaDict.empty(key_type=types.int64, value_type=types.int64)
+        first = NumbaDict.empty(key_type=types.int64, value_type=types.int64)
+        for i in range(ids.shape[0] - n + 1):
+            code = 0
+            for k in range(n):
+                code = code * base + ids[i + k]
+            if code in counts:
+                counts[code] += 1
+            else:
+                counts[code] = 1
+                first[code] = i
+        firsts = np.empty(len(counts), dtype=np.int64)
+        totals = np.empty(len(counts), dtype=np.int64)
+        j = 0
+        for code, c in counts.items():
+            firsts[j] = first[code]
+            totals[j] = c
+            j += 1
+        return firsts, totals
+
+
+def _count_ngrams_jit(words, ids, n, base, top_k=None):
+    """Version Numba du comptage : ne reconstruit chaque n-gram qu'une fois
+    (et seulement les `top_k` plus fréquents si demandé).
+    """
+    firsts, totals = _ngram_counts(ids, n, base)
+    if top_k is not None and totals.shape[0] > top_k:
+        # tri stable : à fréquence égale, ordre de première apparition (comme most_common)
+        keep = np.argsort(-totals, kind="stable")[:top_k]
+        firsts, totals = firsts[keep], totals[keep]
+    return Counter(dict(zip((" ".join(words[i:i + n]) for i in firsts.tolist()), totals.tolist())))
+
+
+def _count_ngrams_incremental(words, ns):
+    """Compte les n-grams pour chaque n de `ns` (n >= 2) en une seule montée en n :
+    les clés de taille n prolongent celles de taille n-1 d'un seul mot,
+    au lieu de recoller n mots pour chaque fenêtre.
+    """
+    result: Dict[int, Counter] = {}
+    keys = words
+    n_top = max(ns)
+    for n in range(2, n_top):
+        w = words
+        keys = [keys[i] + " " + w[i + n - 1] for i in range(len(w) - n + 1)]
+        if n in ns:
+            result[n] = Counter(keys)
+    # dernière taille : les clés ne seront plus prolongées, on les compte sans liste intermédiaire
+    w = words
+    result[n_top] = Counter(keys[i] + " " + w[i + n_top - 1] for i in range(len(w) - n_top + 1))
+    return result
+
+
+def _count_ngrams_coded(words, ns, top_k):
+    """Comme `_count_ngrams_incremental`, mais en comptant des codes entiers
+    (mots → identifiants, fenêtre codée en base len(vocabulaire), sans collision).
+    Seuls les `top_k` n-grams de chaque taille sont reconvertis en texte.
+    """
+    word_to_id: Dict[str, int] = {}
+    ids = [word_to_id.setdefault(w, len(word_to_id)) for w in words]
+    vocab = list(word_to_id)
+    base = len(vocab)
 
     result: Dict[int, Counter] = {}
-    for n in range(int(n_min), int(n_max) + 1):
+    codes = ids
+    n_top = max(ns)
+    for n in range(2, n_top + 1):
+        window_codes = (c * base + i for c, i in zip(codes, ids[n - 1:]))
+        if n == n_top:
+            # dernière taille : comptage direct du générateur, sans liste intermédiaire
+            counts = Counter(window_codes)
+        else:
+            codes = list(window_codes)
+            if n not in ns:
+                continue
+            counts = Counter(codes)
+        top: Dict[str, int] = {}
+        for code, count in counts.most_common(top_k):
+            parts = []
+            for _ in range(n):
+                code, r = divmod(code, base)
+                parts.append(vocab[r])
+            top[" ".join(reversed(parts))] = count
+        result[n] = Counter(top)
+    return result
+
+
+def _keep_top(freq, top_k):
+    if top_k is None or len(freq) <= top_k:
+        return freq
+    return Counter(dict(freq.most_common(top_k)))
+
+
+def tokenize_words(text):
+    """Découpe le texte en mots minuscules d'au moins 3 caractères (chiffres et apostrophes autorisés)."""
+    return _CONTENT_WORD_RE.findall((text or "").lower())
+
+
+def extract_ngrams(text, n_min=1, n_max=5, tokens=None, top_k=None):
+    # `tokens` permet de réutiliser un découpage déjà fait par `tokenize_words` ;
+    # `top_k` limite chaque taille aux n-grams les plus fréquents (seuls reconvertis en texte)
+    if tokens is None:
+        tokens = tokenize_words(text)
+    stop = _stopwords_extended()
+    words = [w for w in tokens if w not in stop]
+
+    # identifiants entiers des mots (vocabulaire propre à la page)
+    ids = None
+    if NUMBA_AVAILABLE and words:
+        word_to_id: Dict[str, int] = {}
+        ids = np.asarray([word_to_id.setdefault(w, len(word_to_id)) for w in words], dtype=np.int32)
+        base = len(word_to_id)
+
+    # dict pré-rempli pour garder les tailles dans l'ordre croissant
+    result: Dict[int, Counter] = dict.fromkeys(range(int(n_min), int(n_max) + 1))
+    remaining = set()
+    for n in result:
         if len(words) < n:
             result[n] = Counter()
-            continue
-        ng = ngrams(words, n)
-        freq = Counter([" ".join(g) for g in ng])
-        # Filtrer les n-grams contenant des stopwords
-        freq = Counter({k: v for k, v in freq.items() 
-                       if not any(w.lower() in STOPWORDS_EXTENDED for w in k.split())})
-        result[n] = freq
+        elif n == 1:
+            # unigrammes : les mots eux-mêmes, sans join
+            result[n] = _keep_top(Counter(words), top_k)
+        elif ids is not None and base ** n <= _MAX_NGRAM_CODE:
+            result[n] = _count_ngrams_jit(words, ids, n, base, top_k)
+        else:
+            remaining.add(n)
+    # `words` est déjà filtré : aucun n-gram ne peut contenir de stopword
+    if remaining and top_k is not None:
+        result.update(_count_ngrams_coded(words, remaining, top_k))
+    elif remaining:
+        result.update(_count_ngrams_incremental(words, remaining))
     return result
 
 
@@ -117,7 +373,15 @@ def extract_ngrams(text, n_min=1, n_max=5):
 # 3. Extraction du maillage interne
 ########################################
 def extract_internal_links(soup, base_url=None):
-    links = set()
+    hrefs = (a["href"] for a in soup.find_all("a", href=True))
+    return _filter_internal_links(hrefs, base_url)
+
+
+def _filter_internal_links(hrefs, base_url=None):
+    """Garde les liens internes parmi `hrefs` (normalisés si base_url fourni).
+    Les doublons sont retirés en conservant l'ordre d'apparition dans la page.
+    """
+    links = {}
     base_netloc = None
     if base_url:
         try:
@@ -125,34 +389,40 @@ def extract_internal_links(soup, base_url=None):
         except Exception:
             base_netloc = None
 
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        if not href or href.startswith("#"):
+    for href in hrefs:
+        href = (href or "").strip()
+        if not href or href[0] == "#":
+            continue
+
+        if not base_url:
+            # garder chemins relatifs (/chemin), pas les URLs //hôte/... sans schéma
+            if href[0] == "/" and href[1:2] != "/":
+                links[href] = None
             continue
 
         # normaliser lien relatif si base_url fourni
-        if base_url:
-            full = urljoin(base_url, href)
-            parsed = urlparse(full)
-            if parsed.netloc == base_netloc:
-                links.add(full)
-        else:
-            # garder chemins relatifs (commencent par /)
-            if href.startswith("/"):
-                links.add(href)
-    return sorted(links)
+        full = urljoin(base_url, href)
+        if ":" not in href and href[:2] != "//":
+            # ni schéma ni hôte : même domaine que base_url, urlparse inutile
+            links[full] = None
+        elif urlparse(full).netloc == base_netloc:
+            links[full] = None
+    return list(links)
 
 
 ########################################
 # 4. Extraction du CSV complet
 ########################################
-def analyze_html(filepath, url=""):
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            html = f.read()
-    except Exception as e:
-        logging.error("Impossible de lire le fichier %s: %s", filepath, e)
-        raise
+# nombre maximal de n-grams conservés dans la colonne "Fréquences"
+MAX_FREQ_ITEMS = 200
+
+
+def _parse_structure_bs4(html, base_url=None, with_text=True):
+    """Extrait les champs structurels de la page avec BeautifulSoup.
+    Si `with_text` est faux, le texte visible n'est pas calculé (chaîne vide).
+    """
+    # bs4 n'est importé que si aucun parseur plus rapide n'est disponible
+    from bs4 import BeautifulSoup
 
     # parser lxml si disponible, sinon html.parser
     try:
@@ -170,29 +440,208 @@ def analyze_html(filepath, url=""):
     if md_tag and md_tag.get("content"):
         meta_desc = md_tag["content"].strip()
 
-    h1 = [h.get_text(strip=True) for h in soup.find_all("h1")]
-    h2 = [h.get_text(strip=True) for h in soup.find_all("h2")]
-    h3 = [h.get_text(strip=True) for h in soup.find_all("h3")]
+    # un seul parcours du DOM pour les titres et les <a> : ancres (#...) et liens hors nav/footer/form
+    headings = {"h1": [], "h2": [], "h3": []}
+    internal_anchors = []
+    hrefs = []
+    for el in soup.find_all(_WALK_TAGS):
+        if el.name != "a":
+            headings[el.name].append(el.get_text(strip=True))
+            continue
+        href = el.get("href", "")
+        if href.startswith("#"):
+            internal_anchors.append(el.get_text(strip=True))
+        elif href and not el.find_parent(_HIDDEN_TAGS):
+            hrefs.append(href)
+    internal_links = _filter_internal_links(hrefs, base_url=base_url)
+
+    visible_text = get_visible_text(soup) if with_text else ""
 
-    internal_anchors = [a.get_text(strip=True)
-                        for a in soup.find_all("a") if a.get("href", "").startswith("#")]
+    return {
+        "title": title,
+        "meta_desc": meta_desc,
+        "h1": headings["h1"],
+        "h2": headings["h2"],
+        "h3": headings["h3"],
+        "internal_anchors": internal_anchors,
+        "visible_text": visible_text,
+        "internal_links": internal_links,
+    }
 
-    visible_text = get_visible_text(soup)
 
-    ngram_freqs = extract_ngrams(visible_text)
-    top_keywords = Counter()
-    for freq in ngram_freqs.values():
-        top_keywords.update(freq)
-    top20 = [kw for kw, _ in top_keywords.most_common(20)]
+def _sx_in_hidden(node):
+    """Vrai si le nœud selectolax est contenu dans une balise de `_HIDDEN_TAGS`."""
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in _HIDDEN_TAGS:
+            return True
+        parent = parent.parent
+    return False
 
-    internal_links = extract_internal_links(soup, base_url=url if url else None)
 
-    # phrases phares = phrases longues ou fréquentes — préférer nltk.sent_tokenize si disponible
+def _parse_structure_selectolax(html, base_url=None, with_text=True):
+    """Équivalent de `_parse_structure_bs4` avec selectolax (arbre en C)."""
+    tree = HTMLParser(html)
+
+    title = ""
+    title_node = tree.css_first("title")
+    if title_node:
+        title = title_node.text(strip=True)
+
+    meta_desc = ""
+    md_node = tree.css_first('meta[name="description"]') or tree.css_first('meta[property="og:description"]')
+    if md_node and md_node.attributes.get("content"):
+        meta_desc = md_node.attributes["content"].strip()
+
+    headings = {"h1": [], "h2": [], "h3": []}
+    internal_anchors = []
+    hrefs = []
+    for n in tree.css(_WALK_SELECTOR):
+        if n.tag != "a":
+            headings[n.tag].append(n.text(strip=True))
+            continue
+        href = n.attributes.get("href") or ""
+        if href.startswith("#"):
+            internal_anchors.append(n.text(strip=True))
+        elif href and not _sx_in_hidden(n):
+            hrefs.append(href)
+    internal_links = _filter_internal_links(hrefs, base_url=base_url)
+
+    visible_text = ""
+    if with_text:
+        tree.strip_tags(list(_HIDDEN_TAGS))
+        root = tree.root
+        visible_text = _WS_RE.sub(" ", root.text(separator=" ")).strip() if root else ""
+
+    return {
+        "title": title,
+        "meta_desc": meta_desc,
+        "h1": headings["h1"],
+        "h2": headings["h2"],
+        "h3": headings["h3"],
+        "internal_anchors": internal_anchors,
+        "visible_text": visible_text,
+        "internal_links": internal_links,
+    }
+
+
+def _read_html(filepath):
     try:
-        sentences = nltk.tokenize.sent_tokenize(visible_text, language='french') if visible_text else []
-    except Exception:
-        sentences = re.split(r"[.!?]+", visible_text) if visible_text else []
-    phrases_phare = [s.strip() for s in sentences if len(s.split()) >= 6][:10]
+        with open(filepath, "r", encoding="utf-8") as f:
+            return f.read()
+    except Exception as e:
+        logging.error("Impossible de lire le fichier %s: %s", filepath, e)
+        raise
+
+
+# les HTML nettoyés sont écrits en UTF-8, pas toujours avec un <meta charset>
+_LXML_PARSER = lxml.html.HTMLParser(encoding="utf-8") if LXML_AVAILABLE else None
+
+# balises dont le texte n'est pas visible ; <template> en plus, comme pour bs4 et selectolax
+# qui n'en comptent pas le contenu dans le texte de la page
+_LXML_TEXT_DROP_TAGS = _HIDDEN_TAGS + ("template",)
+
+
+def _parse_structure_lxml(filepath, base_url=None, with_text=True, html=None):
+    """Équivalent de `_parse_structure_bs4` avec lxml, lu en flux depuis le fichier.
+    Si `html` est fourni (déjà lu par l'appelant), il est parsé directement sans relire le fichier.
+    """
+    try:
+        if html is not None:
+            # document_fromstring refuse un document vide : même résultat que parse() (racine absente) ;
+            # réencodé en octets, car lxml refuse une chaîne avec déclaration <?xml encoding=...?> (XHTML)
+            root = lxml.html.document_fromstring(html.encode("utf-8"), parser=_LXML_PARSER) if html.strip() else None
+        else:
+            # fichier ouvert en texte UTF-8 strict : un fichier mal encodé lève une erreur,
+            # comme `_read_html` pour les autres parseurs, au lieu de caractères de remplacement
+            with open(filepath, "r", encoding="utf-8") as f:
+                root = lxml.html.parse(f, parser=_LXML_PARSER).getroot()
+    except Exception as e:
+        logging.error("Impossible de lire le fichier %s: %s", filepath, e)
+        raise
+
+    page = {
+        "title": "",
+        "meta_desc": "",
+        "h1": [],
+        "h2": [],
+        "h3": [],
+        "internal_anchors": [],
+        "visible_text": "",
+        "internal_links": [],
+    }
+    if root is None:
+        # document vide
+        return page
+
+    def stripped_text(el):
+        # équivalent de bs4 get_text(strip=True)
+        return "".join(t.strip() for t in el.itertext())
+
+    title_el = root.find(".//title")
+    if title_el is not None:
+        page["title"] = stripped_text(title_el)
+
+    md = root.xpath('//meta[@name="description"]/@content') or root.xpath('//meta[@property="og:description"]/@content')
+    if md and md[0]:
+        page["meta_desc"] = md[0].strip()
+
+    hrefs = []
+    for el in root.iter(*_WALK_TAGS):
+        if el.tag != "a":
+            page[el.tag].append(stripped_text(el))
+            continue
+        href = el.get("href") or ""
+        if href.startswith("#"):
+            page["internal_anchors"].append(stripped_text(el))
+        elif href and next(el.iterancestors(*_HIDDEN_TAGS), None) is None:
+            hrefs.append(href)
+    page["internal_links"] = _filter_internal_links(hrefs, base_url=base_url)
+
+    if with_text:
+        for el in list(root.iter(*_LXML_TEXT_DROP_TAGS)):
+            el.drop_tree()
+        page["visible_text"] = _WS_RE.sub(" ", " ".join(root.itertext())).strip()
+
+    return page
+
+
+def analyze_html(filepath, url="", fast_text=False):
+    """Analyse un fichier HTML et retourne une ligne du CSV (dict).
+    `fast_text` extrait le texte visible par regex (`get_visible_text_fast`)
+    au lieu du DOM ; le parseur ne sert alors qu'aux champs structurels.
+    """
+    base_url = url if url else None
+    # seul le parseur lxml lit le fichier en flux ; les autres cas ont besoin du HTML brut
+    streamed = LXML_AVAILABLE and not SELECTOLAX_AVAILABLE
+    html = None if streamed and not fast_text else _read_html(filepath)
+    with_text = not fast_text
+    if SELECTOLAX_AVAILABLE:
+        page = _parse_structure_selectolax(html, base_url=base_url, with_text=with_text)
+    elif LXML_AVAILABLE:
+        page = _parse_structure_lxml(filepath, base_url=base_url, with_text=with_text, html=html)
+    else:
+        page = _parse_structure_bs4(html, base_url=base_url, with_text=with_text)
+    if fast_text:
+        page["visible_text"] = get_visible_text_fast(html)
+    # texte visible et mots calculés une seule fois pour toute l'analyse
+    visible_text = page["visible_text"]
+    tokens = tokenize_words(visible_text)
+
+    # seuls les MAX_FREQ_ITEMS premiers n-grams de chaque taille peuvent figurer dans le CSV
+    ngram_freqs = extract_ngrams(visible_text, tokens=tokens, top_k=MAX_FREQ_ITEMS)
+    # les n-grams de tailles différentes n'ont aucune clé commune : simple fusion
+    # dans un dict, sans re-sommer comme Counter.update
+    top_keywords = {}
+    for freq in ngram_freqs.values():
+        top_keywords.update(freq)
+    # une seule sélection top-K : les 20 mots-clés dominants en sont le préfixe (tri stable)
+    top_items = Counter(top_keywords).most_common(MAX_FREQ_ITEMS)
+    top20 = [kw for kw, _ in top_items[:20]]
+
+    # phrases phares = phrases longues (6 mots ou plus) ; le texte visible n'a que des espaces simples
+    sentences = _SENT_SPLIT_RE.split(visible_text) if visible_text else []
+    phrases_phare = [s.strip() for s in sentences if s.count(" ") >= 5][:10]
 
     # conversion ngrams → texte brut (format lisible)
     parts: List[str] = []
@@ -204,20 +653,18 @@ def analyze_html(filepath, url=""):
         parts.append(f"{n}-grams: {items}")
     ngram_text = "; ".join(parts)
 
-    top_freqs = {k: v for k, v in top_keywords.items()}
-
     return {
         "URL": url,
-        "Title": title,
-        "H1": " | ".join(h1),
-        "H2": " | ".join(h2),
-        "H3": " | ".join(h3),
-        "Meta description": meta_desc,
-        "Ancres internes": " | ".join(internal_anchors),
+        "Title": page["title"],
+        "H1": " | ".join(page["h1"]),
+        "H2": " | ".join(page["h2"]),
+        "H3": " | ".join(page["h3"]),
+        "Meta description": page["meta_desc"],
+        "Ancres internes": " | ".join(page["internal_anchors"]),
         "Mots-clés dominants": " | ".join(top20),
         "N-grams": ngram_text,
-        "Fréquences": str(top_freqs),
-        "Liens internes": " | ".join(internal_links),
+        "Fréquences": json.dumps(dict(top_items), ensure_ascii=False),
+        "Liens internes": " | ".join(page["internal_links"]),
         "Phrases phares": " | ".join(phrases_phare),
         "Extrait de texte principal": (visible_text or "")[:600] + ("..." if visible_text and len(visible_text) > 600 else "")
     }
@@ -226,17 +673,26 @@ def analyze_html(filepath, url=""):
 ########################################
 # 5. Export CSV
 ########################################
-def export_csv(data, output="analyse.csv"):
+def export_csv(rows, output="analyse.csv"):
+    """Écrit une analyse (dict) ou un itérable d'analyses dans un CSV.
+    Le fichier est ouvert une seule fois et les lignes écrites au fil de l'eau :
+    l'itérable peut être un générateur (ex: résultats d'un pool de processus).
+    """
     # s'assurer que le répertoire existe
     out_dir = os.path.dirname(os.path.abspath(output))
     if out_dir and not os.path.exists(out_dir):
         os.makedirs(out_dir, exist_ok=True)
 
-    fieldnames = list(data.keys())
+    rows = iter([rows] if isinstance(rows, dict) else rows)
+    first = next(rows, None)
     with open(output, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerow(data)
+        if first is not None:
+            # en-tête déduit de la première ligne, écrit une seule fois
+            writer = csv.DictWriter(f, fieldnames=list(first.keys()))
+            writer.writeheader()
+            writer.writerow(first)
+            for row in rows:
+                writer.writerow(row)
 
     logging.info("CSV écrit: %s", output)
 
@@ -246,27 +702,48 @@ def export_csv(data, output="analyse.csv"):
 ########################################
 def _build_arg_parser():
     p = argparse.ArgumentParser(description="Analyse simple de structure HTML — extrait titres, n-grams, liens internes, etc.")
-    p.add_argument("input", help="Fichier HTML en entrée")
+    p.add_argument("input", help="Fichier HTML, dossier ou motif glob (ex: 'pages/*.html') en entrée")
     p.add_argument("-u", "--url", default="", help="URL de base (pour normaliser les liens internes)")
     p.add_argument("-o", "--output", default="analyse.csv", help="Fichier CSV de sortie")
     p.add_argument("--nmin", type=int, default=1, help="N-gram min (par défaut 1)")
     p.add_argument("--nmax", type=int, default=5, help="N-gram max (par défaut 5)")
     p.add_argument("--top", type=int, default=20, help="Nombre de mots-clés dominants à garder")
+    p.add_argument("--fast-text", action="store_true",
+                   help="Extraire le texte visible par regex plutôt que via le DOM (plus rapide, approximatif)")
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                   help="Nombre de processus pour analyser plusieurs fichiers (défaut: nombre de CPU)")
     p.add_argument("--verbose", action="store_true", help="Mode verbeux (logging DEBUG)")
     return p
 
 
+def _collect_inputs(spec):
+    """Liste les fichiers HTML désignés par un chemin, un dossier ou un motif glob."""
+    if os.path.isfile(spec):
+        return [spec]
+    if os.path.isdir(spec):
+        return sorted(glob.glob(os.path.join(spec, "*.html")) + glob.glob(os.path.join(spec, "*.htm")))
+    return sorted(p for p in glob.glob(spec) if os.path.isfile(p))
+
+
 def main(argv=None):
     args = _build_arg_parser().parse_args(argv)
     logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
                         format="%(levelname)s: %(message)s")
 
-    if not os.path.exists(args.input):
+    paths = _collect_inputs(args.input)
+    if not paths:
         logging.error("Fichier d'entrée introuvable: %s", args.input)
         sys.exit(2)
 
-    data = analyze_html(args.input, url=args.url)
-    export_csv(data, args.output)
+    ensure_nltk_resources()
+
+    if len(paths) == 1 or args.jobs <= 1:
+        export_csv((analyze_html(path, url=args.url, fast_text=args.fast_text) for path in paths), args.output)
+    else:
+        # analyse CPU-bound : un processus par cœur, NLTK/lxml chargés une fois par worker
+        logging.info("%d fichiers à analyser (%d processus)", len(paths), args.jobs)
+        with ProcessPoolExecutor(max_workers=args.jobs) as ex:
+            export_csv(ex.map(analyze_html, paths, repeat(args.url), repeat(args.fast_text)), args.output)
     print(f"Analyse terminée → {args.output} généré")
 
 
@@ -15,6 +15,8 @@ Options:
   --keep-temp       : conserver les fichiers HTML temporaires après analyse
   --no-pdf          : ne pas générer le rapport PDF
   --timeout         : timeout pour les requêtes HTTP en secondes (défaut: 10)
+  --concurrency / -c: nombre de téléchargements simultanés (défaut: 16)
+  --jobs / -j       : nombre de processus pour l'analyse des pages (défaut: nombre de CPU)
   --verbose / -v    : mode verbeux
 """
 
@@ -23,138 +25,177 @@ import sys
 import csv
 import argparse
 import logging
-import subprocess
+import asyncio
 import shutil
 import ast
+import json
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
-from analyse_structure_html import analyze_html
+from functools import lru_cache
+from urllib.parse import urlparse
+from analyse_structure_html import analyze_html, ensure_nltk_resources
+from scrap_clean.clean_html import clean_html_text, fetch_url, DEFAULT_USER_AGENT
 
-# Import matplotlib pour les visualisations
+# orjson (optionnel) : décodage JSON plus rapide que le module standard
 try:
-    import matplotlib
-    matplotlib.use('Agg')  # Backend non-interactif
-    import matplotlib.pyplot as plt
-    import numpy as np
-    MATPLOTLIB_AVAILABLE = True
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    logging.warning("matplotlib non disponible, visualisations désactivées")
+    _json_loads = json.loads
 
-# Import wordcloud
+# httpx (optionnel) : client HTTP asynchrone avec connexions keep-alive
+# sans lui, les téléchargements passent par requests dans des threads
 try:
-    from wordcloud import WordCloud
-    WORDCLOUD_AVAILABLE = True
+    import httpx
+    HTTPX_AVAILABLE = True
 except ImportError:
-    WORDCLOUD_AVAILABLE = False
-    logging.warning("wordcloud non disponible")
+    HTTPX_AVAILABLE = False
 
-# Import networkx pour réseau sémantique
-try:
-    import networkx as nx
-    NETWORKX_AVAILABLE = True
-except ImportError:
-    NETWORKX_AVAILABLE = False
-    logging.warning("networkx non disponible")
+# matplotlib, numpy, wordcloud, networkx, pandas et reportlab sont importés dans les fonctions
+# qui les utilisent : un run sans PDF ni visualisation (ou un worker) ne les charge pas
 
-# Import pandas pour PDF
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
 
-# Import reportlab pour PDF
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-    from reportlab.lib import colors
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-    logging.warning("reportlab non disponible, pas de génération PDF")
+# ponctuation retirée aux extrémités des mots des phrases phares
+# (strip et non translate : les apostrophes internes, ex. "l'eau", sont conservées)
+_PHRASE_PUNCT = '.,!?;:()\'"'
+
+# résolution des PNG : les images sont affichées en 6.5" × 4" dans le PDF,
+# 100 dpi suffisent (150 dpi encodaient ~2x plus de pixels pour rien)
+_SAVE_DPI = 100
+
+# tampon d'écriture des CSV (1 Mo) : moins d'appels système que le tampon par défaut
+_CSV_BUFFER_SIZE = 1 << 20
 
 
 def read_urls(file_path):
     """Lit un fichier texte contenant une URL par ligne."""
-    urls = []
     with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                urls.append(line)
-    return urls
-
-
-def clean_html_from_url(url, output_path, timeout=10, verbose=False):
-    """Appelle clean_html.py pour télécharger et nettoyer une URL."""
-    script_path = Path(__file__).parent / "scrap_clean" / "clean_html.py"
-    
-    if not script_path.exists():
-        raise FileNotFoundError(f"Script clean_html.py introuvable: {script_path}")
-    
-    cmd = [
-        sys.executable,
-        str(script_path),
-        "--url", url,
-        "--output", str(output_path),
-        "--timeout", str(timeout)
-    ]
-    
-    if verbose:
-        cmd.append("--verbose")
-    
+        return [line for line in map(str.strip, f) if line and line[0] != '#']
+
+
+async def fetch_and_clean(client, url, output_path, timeout=10, verbose=False):
+    """Télécharge une URL, la nettoie (clean_html) et écrit le HTML nettoyé dans output_path.
+    `client` est un httpx.AsyncClient, ou None pour utiliser requests dans un thread.
+    `verbose` affiche le détail du nettoyage (comme `clean_html.py --verbose`).
+    """
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        if verbose:
-            logging.debug(f"clean_html.py output: {result.stdout}")
+        if client is not None:
+            response = await client.get(url, timeout=timeout)
+            response.raise_for_status()
+            html = response.content
+        else:
+            html = await asyncio.to_thread(fetch_url, url, timeout)
+        # nettoyage hors de la boucle d'événements pour ne pas bloquer les autres téléchargements
+        out_text, _ = await asyncio.to_thread(clean_html_text, html, verbose=verbose)
+        Path(output_path).write_text(out_text, encoding='utf-8', errors='replace')
         return True
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Erreur lors du nettoyage de {url}: {e.stderr}")
+    except Exception as e:
+        logging.error(f"Erreur lors du nettoyage de {url}: {e}")
         return False
 
 
-def aggregate_keywords(all_data):
-    """Agrège tous les mots-clés, n-grams et phrases phares de toutes les pages."""
+async def fetch_and_clean_all(jobs, timeout=10, concurrency=16, verbose=False):
+    """Télécharge et nettoie toutes les URLs de `jobs` [(url, output_path)] en parallèle.
+    Retourne la liste des succès (bool) dans l'ordre de `jobs`.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(client, url, output_path):
+        async with semaphore:
+            logging.info(f"  → Téléchargement et nettoyage de {url}")
+            return await fetch_and_clean(client, url, output_path, timeout=timeout, verbose=verbose)
+
+    if not HTTPX_AVAILABLE:
+        return await asyncio.gather(*(run(None, url, path) for url, path in jobs))
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, headers={'User-Agent': DEFAULT_USER_AGENT},
+                                 follow_redirects=True) as client:
+        return await asyncio.gather(*(run(client, url, path) for url, path in jobs))
+
+
+def parse_frequencies(freq_str):
+    """Décode la colonne 'Fréquences' en dict {n-gram: occurrences}.
+    Format JSON ; les anciens CSV (repr() d'un dict Python) restent lisibles.
+    Retourne None si la valeur est illisible.
+    """
+    text = str(freq_str).strip()
+    if not text or text == '{}':
+        return {}
+    try:
+        return _json_loads(text)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return None
+
+
+def parse_page(data):
+    """Décode une seule fois les colonnes d'une ligne d'analyse utilisées par l'agrégation
+    et les visualisations.
+    
+    Returns:
+        dict avec 'dominants' (liste des mots-clés dominants), 'freq' (dict des n-grams,
+        None si illisible), 'phrase_words' (mots des phrases phares) et 'keywords'
+        (ensemble mots-clés dominants + n-grams de la page)
+    """
+    get = data.get
+    
+    keywords_str = get('Mots-clés dominants', '')
+    dominants = [kw for kw in map(str.strip, str(keywords_str).split('|')) if kw] if keywords_str else []
+    
+    freq_str = get('Fréquences', '')
+    freq = parse_frequencies(freq_str) if freq_str and freq_str != '{}' else {}
+    
+    phrase_words = []
+    phrases_str = get('Phrases phares', '')
+    if phrases_str:
+        # mise en minuscules en une passe sur toute la colonne plutôt que phrase par phrase ;
+        # une seule compréhension (strip + filtre de longueur), sans générateur intermédiaire
+        phrase_words = [
+            word
+            for phrase in str(phrases_str).lower().split('|')
+            for token in phrase.split()
+            if len(word := token.strip(_PHRASE_PUNCT)) > 2
+        ]
+    
+    keywords = set(dominants)
+    if freq:
+        keywords.update(freq)
+    
+    return {'dominants': dominants, 'freq': freq, 'phrase_words': phrase_words, 'keywords': keywords}
+
+
+def aggregate_keywords(all_data, parsed_pages=None):
+    """Agrège tous les mots-clés, n-grams et phrases phares de toutes les pages.
+    `parsed_pages` : résultats de parse_page pour chaque page (calculés si absents).
+    """
+    if parsed_pages is None:
+        parsed_pages = [parse_page(data) for data in all_data]
+    
     all_keywords = Counter()
+    # Counter.update : boucle de comptage en C plutôt qu'un `+= 1` Python par élément.
+    # Pas de noyau Numba ici : convertir les chaînes en entiers (vocabulaire) coûte déjà
+    # plus cher que le comptage complet par Counter.update.
+    update = all_keywords.update
     
-    for data in all_data:
+    for page in parsed_pages:
         # 1. Mots-clés dominants
-        keywords_str = data.get('Mots-clés dominants', '')
-        if keywords_str:
-            keywords = [kw.strip() for kw in str(keywords_str).split('|') if kw.strip()]
-            for kw in keywords:
-                all_keywords[kw] += 1
-        
-        # 2. N-grams depuis Fréquences
-        freq_str = data.get('Fréquences', '')
-        if freq_str and freq_str != '{}':
-            try:
-                freq_dict = ast.literal_eval(str(freq_str))
-                for ngram, count in freq_dict.items():
-                    all_keywords[ngram] += count
-            except (ValueError, SyntaxError):
-                continue
+        update(page['dominants'])
+        
+        # 2. N-grams depuis Fréquences (un mapping : ses occurrences sont additionnées)
+        # une colonne illisible fait ignorer le reste de la page
+        if page['freq'] is None:
+            continue
+        update(page['freq'])
         
         # 3. Mots des phrases phares
-        phrases_str = data.get('Phrases phares', '')
-        if phrases_str:
-            phrases = [p.strip() for p in str(phrases_str).split('|') if p.strip()]
-            for phrase in phrases:
-                words = phrase.lower().split()
-                for word in words:
-                    word = word.strip('.,!?;:()\'"')
-                    if len(word) > 2:
-                        all_keywords[word] += 1
+        update(page['phrase_words'])
     
     return all_keywords
 
@@ -163,73 +204,92 @@ def save_aggregated_csv(aggregated, output_path, top_n=50):
     """Sauvegarde l'agrégation globale dans un CSV."""
     top_keywords = aggregated.most_common(top_n)
     
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(['Rang', 'Mot-clé / N-gram', 'Occurrences'])
-        for i, (keyword, count) in enumerate(top_keywords, 1):
-            writer.writerow([i, keyword, count])
+        writer.writerows((i, keyword, count) for i, (keyword, count) in enumerate(top_keywords, 1))
     
     logging.info(f"CSV d'agrégation sauvegardé: {output_path}")
 
 
-def read_aggregated_csv(csv_path):
-    """Lit le CSV d'agrégation globale."""
-    data = []
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            data.append(row)
-    return data
+def _new_figure(figsize):
+    """Crée une figure Agg hors pyplot et son unique axe."""
+    # API objet (Figure + canvas Agg) : pas de registre global pyplot, figures libérées avec l'objet
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot(111)
 
 
-def generate_visualizations(all_data, aggregated, output_dir, global_phrases=None):
-    """Génère les visualisations et les sauvegarde."""
-    if not MATPLOTLIB_AVAILABLE:
+def _save_figure(fig, path):
+    """Sauvegarde la figure puis libère son contenu."""
+    try:
+        fig.savefig(path, dpi=_SAVE_DPI, bbox_inches='tight')
+    finally:
+        fig.clf()
+
+
+def generate_visualizations(all_data, aggregated, output_dir, global_phrases=None, parsed_pages=None):
+    """Génère les visualisations et les sauvegarde.
+    `parsed_pages` : résultats de parse_page pour chaque page (calculés si absents).
+    """
+    try:
+        import matplotlib  # noqa: F401
+        import numpy as np
+    except ImportError:
         logging.warning("Matplotlib non disponible, visualisations ignorées")
         return
     
     viz_dir = Path(output_dir) / "visualisations"
     viz_dir.mkdir(exist_ok=True)
     
+    if parsed_pages is None:
+        parsed_pages = [parse_page(data) for data in all_data]
+    
     # 1. Top 20 global des mots-clés
     logging.info("Génération: Top 20 global des mots-clés...")
     top20 = aggregated.most_common(20)
     if top20:
         keywords, counts = zip(*top20)
         
-        plt.figure(figsize=(14, 8))
-        plt.barh(range(len(keywords)), counts, color='teal', edgecolor='black')
-        plt.yticks(range(len(keywords)), keywords)
-        plt.xlabel('Nombre d\'occurrences', fontsize=12)
-        plt.ylabel('Mots-clés / N-grams', fontsize=12)
-        plt.title('Top 20 des mots-clés et n-grams (agrégé sur toutes les pages)', 
-                  fontsize=14, fontweight='bold')
-        plt.gca().invert_yaxis()
-        plt.tight_layout()
-        plt.savefig(viz_dir / 'top20_global.png', dpi=150, bbox_inches='tight')
-        plt.close()
+        fig, ax = _new_figure((14, 8))
+        ax.barh(range(len(keywords)), counts, color='teal', edgecolor='black')
+        ax.set_yticks(range(len(keywords)))
+        ax.set_yticklabels(keywords)
+        ax.set_xlabel('Nombre d\'occurrences', fontsize=12)
+        ax.set_ylabel('Mots-clés / N-grams', fontsize=12)
+        ax.set_title('Top 20 des mots-clés et n-grams (agrégé sur toutes les pages)', 
+                     fontsize=14, fontweight='bold')
+        ax.invert_yaxis()
+        fig.tight_layout()
+        _save_figure(fig, viz_dir / 'top20_global.png')
     
     # 2. Distribution du nombre de liens internes
     logging.info("Génération: Distribution des liens internes...")
-    link_counts = []
-    for data in all_data:
-        liens = data.get('Liens internes', '')
-        if liens:
-            count = len([l for l in liens.split('|') if l.strip()])
-            link_counts.append(count)
+    # les liens sont joints par " | " sans segment vide : compter les séparateurs suffit
+    link_counts = [
+        liens.count('|') + 1
+        for liens in (str(data.get('Liens internes', '') or '') for data in all_data)
+        if liens.strip()
+    ]
     
     if link_counts:
-        plt.figure(figsize=(10, 6))
-        plt.hist(link_counts, bins=20, color='coral', edgecolor='black')
-        plt.xlabel('Nombre de liens internes', fontsize=12)
-        plt.ylabel('Fréquence', fontsize=12)
-        plt.title('Distribution du nombre de liens internes par page', fontsize=14, fontweight='bold')
-        plt.tight_layout()
-        plt.savefig(viz_dir / 'distribution_liens.png', dpi=150, bbox_inches='tight')
-        plt.close()
+        fig, ax = _new_figure((10, 6))
+        ax.hist(link_counts, bins=20, color='coral', edgecolor='black')
+        ax.set_xlabel('Nombre de liens internes', fontsize=12)
+        ax.set_ylabel('Fréquence', fontsize=12)
+        ax.set_title('Distribution du nombre de liens internes par page', fontsize=14, fontweight='bold')
+        fig.tight_layout()
+        _save_figure(fig, viz_dir / 'distribution_liens.png')
     
     # 3. Word Cloud
-    if WORDCLOUD_AVAILABLE:
+    try:
+        from wordcloud import WordCloud
+    except ImportError:
+        WordCloud = None
+        logging.warning("wordcloud non disponible")
+    if WordCloud is not None:
         logging.info("Génération: Word Cloud...")
         try:
             # Créer un dictionnaire pour WordCloud
@@ -246,59 +306,52 @@ def generate_visualizations(all_data, aggregated, output_dir, global_phrases=Non
                 collocations=False
             ).generate_from_frequencies(wc_freq)
             
-            plt.figure(figsize=(16, 9))
-            plt.imshow(wordcloud, interpolation='bilinear')
-            plt.axis('off')
-            plt.tight_layout(pad=0)
-            plt.savefig(viz_dir / 'wordcloud.png', dpi=150, bbox_inches='tight')
-            plt.close()
+            fig, ax = _new_figure((16, 9))
+            ax.imshow(wordcloud, interpolation='bilinear')
+            ax.axis('off')
+            fig.tight_layout(pad=0)
+            _save_figure(fig, viz_dir / 'wordcloud.png')
         except Exception as e:
             logging.warning(f"Erreur lors de la génération du word cloud: {e}")
     
     # 4. Réseau sémantique (Co-occurrence)
-    if NETWORKX_AVAILABLE:
+    try:
+        import networkx as nx
+    except ImportError:
+        nx = None
+        logging.warning("networkx non disponible")
+    if nx is not None:
         logging.info("Génération: Réseau sémantique...")
         try:
             # Créer le graphe à partir des co-occurrences
             top_keywords_list = [k for k, _ in aggregated.most_common(30)]
+            kw_to_idx = {kw: i for i, kw in enumerate(top_keywords_list)}
             graph = nx.Graph()
             
             # Ajouter les nœuds
             for kw in top_keywords_list:
                 graph.add_node(kw)
             
-            # Ajouter les arêtes basées sur les co-occurrences
-            for data in all_data:
-                # Combiner tous les mots-clés de cette page
-                page_keywords = set()
-                
-                # From 'Mots-clés dominants'
-                keywords_str = data.get('Mots-clés dominants', '')
-                if keywords_str:
-                    keywords = [kw.strip() for kw in str(keywords_str).split('|') if kw.strip()]
-                    page_keywords.update(keywords)
-                
-                # From 'Fréquences'
-                freq_str = data.get('Fréquences', '')
-                if freq_str and freq_str != '{}':
-                    try:
-                        freq_dict = ast.literal_eval(str(freq_str))
-                        page_keywords.update(freq_dict.keys())
-                    except (ValueError, SyntaxError):
-                        pass
-                
-                # Créer des connexions entre les mots-clés de cette page
-                page_keywords_list = [kw for kw in page_keywords if kw in top_keywords_list]
-                for i, kw1 in enumerate(page_keywords_list):
-                    for kw2 in page_keywords_list[i+1:]:
-                        if graph.has_edge(kw1, kw2):
-                            graph[kw1][kw2]['weight'] += 1
-                        else:
-                            graph.add_edge(kw1, kw2, weight=1)
+            # Matrice de co-occurrences (top 30 × top 30) cumulée page par page
+            cooc = np.zeros((len(top_keywords_list), len(top_keywords_list)), dtype=np.int32)
+            for page in parsed_pages:
+                # Connexions entre les mots-clés de cette page : produit extérieur du vecteur de présence
+                idx = [kw_to_idx[kw] for kw in page['keywords'] if kw in kw_to_idx]
+                if len(idx) > 1:
+                    presence = np.zeros(len(top_keywords_list), dtype=np.int32)
+                    presence[idx] = 1
+                    cooc += np.outer(presence, presence)
+            
+            # Ajouter les arêtes (paires non nulles du triangle supérieur, poids = nb de pages)
+            cooc = np.triu(cooc, k=1)
+            graph.add_weighted_edges_from(
+                (top_keywords_list[i], top_keywords_list[j], int(cooc[i, j]))
+                for i, j in np.argwhere(cooc > 0)
+            )
             
             # Générer la visualisation
             if graph.number_of_edges() > 0:
-                plt.figure(figsize=(16, 12))
+                fig, ax = _new_figure((16, 12))
                 
                 # Layout du graphe
                 pos = nx.spring_layout(graph, k=2, iterations=50, seed=42)
@@ -316,91 +369,84 @@ def generate_visualizations(all_data, aggregated, output_dir, global_phrases=Non
                     node_color='lightblue',
                     edgecolors='navy',
                     linewidths=2,
-                    alpha=0.8
+                    alpha=0.8,
+                    ax=ax
                 )
                 
                 nx.draw_networkx_edges(
                     graph, pos,
                     width=edge_widths,
                     alpha=0.5,
-                    edge_color='gray'
+                    edge_color='gray',
+                    ax=ax
                 )
                 
                 nx.draw_networkx_labels(
                     graph, pos,
                     font_size=9,
                     font_weight='bold',
-                    font_color='darkblue'
+                    font_color='darkblue',
+                    ax=ax
                 )
                 
-                plt.title('Réseau sémantique - Co-occurrences des mots-clés', 
-                         fontsize=14, fontweight='bold')
-                plt.axis('off')
-                plt.tight_layout()
-                plt.savefig(viz_dir / 'reseau_semantique.png', dpi=150, bbox_inches='tight')
-                plt.close()
+                ax.set_title('Réseau sémantique - Co-occurrences des mots-clés', 
+                             fontsize=14, fontweight='bold')
+                ax.axis('off')
+                fig.tight_layout()
+                _save_figure(fig, viz_dir / 'reseau_semantique.png')
         except Exception as e:
             logging.warning(f"Erreur lors de la génération du réseau sémantique: {e}")
     
     # 5. Heatmap : Mots-clés par page
-    logging.info("Génération: Heatmap mots-clés/pages...")
     try:
         import pandas as pd
-        
-        # Créer une matrice : pages × top 20 mots-clés
-        top20_keywords = [k for k, _ in aggregated.most_common(20)]
-        
-        data_matrix = []
-        page_labels = []
-        
-        for i, data in enumerate(all_data):
-            page_label = data.get('URL', f'Page {i+1}').split('/')[-1] or f'Page {i+1}'
-            page_labels.append(page_label[:30])  # Limiter la longueur
-            
-            row = []
-            page_keywords = set()
-            
-            # Compter les occurrences de chaque mot-clé dans cette page
-            keywords_str = data.get('Mots-clés dominants', '')
-            if keywords_str:
-                keywords = [kw.strip() for kw in str(keywords_str).split('|') if kw.strip()]
-                page_keywords.update(keywords)
+        import seaborn as sns
+    except ImportError:
+        pd = sns = None
+        logging.warning("pandas/seaborn non disponible, heatmap ignorée")
+    if pd is not None:
+        logging.info("Génération: Heatmap mots-clés/pages...")
+        try:
+            # Créer une matrice : pages × top 20 mots-clés
+            top20_keywords = [k for k, _ in aggregated.most_common(20)]
+            top20_set = set(top20_keywords)
             
-            freq_str = data.get('Fréquences', '')
-            if freq_str and freq_str != '{}':
-                try:
-                    freq_dict = ast.literal_eval(str(freq_str))
-                    for kw, count in freq_dict.items():
-                        if kw in top20_keywords:
-                            page_keywords.add(kw)
-                except (ValueError, SyntaxError):
-                    pass
+            page_labels = []
+            for i, data in enumerate(all_data):
+                page_label = data.get('URL', f'Page {i+1}').split('/')[-1] or f'Page {i+1}'
+                page_labels.append(page_label[:30])  # Limiter la longueur
             
-            for kw in top20_keywords:
-                row.append(1 if kw in page_keywords else 0)
+            # Paires (page, mot-clé) au format long puis tableau croisé de présence ;
+            # les pages sont indexées par position (des libellés peuvent se répéter)
+            pairs = [(i, kw) for i, page in enumerate(parsed_pages) for kw in page['keywords'] if kw in top20_set]
+            df_pairs = pd.DataFrame(pairs, columns=['page', 'kw'])
+            df_heatmap = (
+                pd.crosstab(df_pairs['page'], df_pairs['kw'])
+                .reindex(index=range(len(all_data)), columns=top20_keywords, fill_value=0)
+                .clip(upper=1)
+                .rename_axis(index=None, columns=None)
+            )
+            df_heatmap.index = page_labels
             
-            data_matrix.append(row)
-        
-        df_heatmap = pd.DataFrame(data_matrix, columns=top20_keywords, index=page_labels)
-        
-        plt.figure(figsize=(14, max(8, len(all_data) * 0.4)))
-        import seaborn as sns
-        sns.heatmap(
-            df_heatmap,
-            cmap='YlOrRd',
-            cbar_kws={'label': 'Présence'},
-            linewidths=0.5,
-            linecolor='gray'
-        )
-        plt.title('Présence des top 20 mots-clés par page', fontsize=14, fontweight='bold')
-        plt.xlabel('Mots-clés', fontsize=12)
-        plt.ylabel('Pages', fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.savefig(viz_dir / 'heatmap_keywords_pages.png', dpi=150, bbox_inches='tight')
-        plt.close()
-    except Exception as e:
-        logging.warning(f"Erreur lors de la génération de la heatmap: {e}")
+            fig, ax = _new_figure((14, max(8, len(all_data) * 0.4)))
+            sns.heatmap(
+                df_heatmap,
+                cmap='YlOrRd',
+                cbar_kws={'label': 'Présence'},
+                linewidths=0.5,
+                linecolor='gray',
+                ax=ax
+            )
+            ax.set_title('Présence des top 20 mots-clés par page', fontsize=14, fontweight='bold')
+            ax.set_xlabel('Mots-clés', fontsize=12)
+            ax.set_ylabel('Pages', fontsize=12)
+            for label in ax.get_xticklabels():
+                label.set_rotation(45)
+                label.set_ha('right')
+            fig.tight_layout()
+            _save_figure(fig, viz_dir / 'heatmap_keywords_pages.png')
+        except Exception as e:
+            logging.warning(f"Erreur lors de la génération de la heatmap: {e}")
     
     # 6. Top phrases phares globales
     if global_phrases:
@@ -413,24 +459,37 @@ def generate_visualizations(all_data, aggregated, output_dir, global_phrases=Non
                 phrases_text = [p[0][:50] + "..." if len(p[0]) > 50 else p[0] for p in top_phrases]
                 phrases_scores = [p[3] for p in top_phrases]
                 
-                plt.figure(figsize=(14, 8))
-                plt.barh(range(len(phrases_text)), phrases_scores, color='mediumpurple', edgecolor='black')
-                plt.yticks(range(len(phrases_text)), phrases_text, fontsize=10)
-                plt.xlabel('Score de pertinence (fréquence × longueur)', fontsize=12)
-                plt.title('Top 15 phrases phares (agrégation globale)', fontsize=14, fontweight='bold')
-                plt.gca().invert_yaxis()
-                plt.tight_layout()
-                plt.savefig(viz_dir / 'top_phrases_globales.png', dpi=150, bbox_inches='tight')
-                plt.close()
+                fig, ax = _new_figure((14, 8))
+                ax.barh(range(len(phrases_text)), phrases_scores, color='mediumpurple', edgecolor='black')
+                ax.set_yticks(range(len(phrases_text)))
+                ax.set_yticklabels(phrases_text, fontsize=10)
+                ax.set_xlabel('Score de pertinence (fréquence × longueur)', fontsize=12)
+                ax.set_title('Top 15 phrases phares (agrégation globale)', fontsize=14, fontweight='bold')
+                ax.invert_yaxis()
+                fig.tight_layout()
+                _save_figure(fig, viz_dir / 'top_phrases_globales.png')
         except Exception as e:
             logging.warning(f"Erreur lors de la génération du graphique de phrases: {e}")
     
     logging.info(f"Visualisations sauvegardées dans {viz_dir}")
 
 
-def generate_pdf_report(all_data, aggregated, output_dir, data_global, global_phrases=None):
+@lru_cache(maxsize=4096)
+def _netloc(url):
+    """Domaine d'une URL ('N/A' si absent), mémoïsé pour les URLs répétées."""
+    return urlparse(url).netloc or 'N/A'
+
+
+def generate_pdf_report(all_data, aggregated, output_dir, global_phrases=None):
     """Génère un rapport PDF complet."""
-    if not REPORTLAB_AVAILABLE:
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+        from reportlab.lib import colors
+    except ImportError:
         logging.warning("reportlab non disponible, génération PDF ignorée")
         return
     
@@ -505,9 +564,7 @@ def generate_pdf_report(all_data, aggregated, output_dir, data_global, global_ph
         
         for i, url in enumerate(urls, 1):
             if url:
-                from urllib.parse import urlparse
-                parsed = urlparse(str(url))
-                domain = parsed.netloc or 'N/A'
+                domain = _netloc(str(url))
                 unique_domains.add(domain)
                 url_data.append([str(i), domain, str(url)[:60] + ('...' if len(str(url)) > 60 else '')])
         
@@ -536,13 +593,10 @@ def generate_pdf_report(all_data, aggregated, output_dir, data_global, global_ph
         content.append(Paragraph("Analyse Globale - Top 50 Mots-clés et N-grams", heading_style))
         content.append(Spacer(1, 0.2*inch))
         
+        # top 50 lu directement dans le Counter agrégé (même contenu que analyse_globale.csv)
+        top50 = aggregated.most_common(50)
         global_data = [['Rang', 'Mot-clé / N-gram', 'Occurrences']]
-        for row in data_global[:50]:
-            global_data.append([
-                row['Rang'],
-                str(row['Mot-clé / N-gram'])[:50],
-                row['Occurrences']
-            ])
+        global_data.extend([str(i), str(keyword)[:50], str(count)] for i, (keyword, count) in enumerate(top50, 1))
         
         global_table = Table(global_data, colWidths=[0.7*inch, 3.5*inch, 1.3*inch])
         global_table.setStyle(TableStyle([
@@ -626,8 +680,8 @@ def generate_pdf_report(all_data, aggregated, output_dir, data_global, global_ph
         content.append(Paragraph("Conclusion", heading_style))
         content.append(Spacer(1, 0.3*inch))
         
-        top_keyword = data_global[0]['Mot-clé / N-gram'] if data_global else "N/A"
-        top_count = data_global[0]['Occurrences'] if data_global else "N/A"
+        top_keyword = top50[0][0] if top50 else "N/A"
+        top_count = top50[0][1] if top50 else "N/A"
         
         conclusion_text = f"""
         <b>Résumé de l'analyse:</b><br/><br/>
@@ -660,7 +714,8 @@ def generate_pdf_report(all_data, aggregated, output_dir, data_global, global_ph
         logging.error(f"Erreur lors de la génération du PDF: {e}")
 
 
-def process_urls(urls, temp_dir, output_dir, timeout=10, verbose=False, generate_pdf=True):
+def process_urls(urls, temp_dir, output_dir, timeout=10, verbose=False, generate_pdf=True, concurrency=16,
+                 jobs=None):
     """Traite chaque URL : télécharge, nettoie, analyse, et génère les outputs."""
     all_data = []
     
@@ -670,38 +725,51 @@ def process_urls(urls, temp_dir, output_dir, timeout=10, verbose=False, generate
     temp_path.mkdir(parents=True, exist_ok=True)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Traiter chaque URL
-    for i, url in enumerate(urls, 1):
-        logging.info(f"[{i}/{len(urls)}] Traitement de {url}")
-        
-        html_filename = f"page_{i:03d}.html"
-        html_path = temp_path / html_filename
-        
-        try:
-            # 1. Télécharger et nettoyer le HTML
-            logging.info(f"  → Téléchargement et nettoyage...")
-            success = clean_html_from_url(url, html_path, timeout=timeout, verbose=verbose)
+    # 1. Télécharger et nettoyer toutes les pages en parallèle
+    pages = [(url, temp_path / f"page_{i:03d}.html") for i, url in enumerate(urls, 1)]
+    logging.info(f"Téléchargement et nettoyage de {len(pages)} URL(s) ({concurrency} en parallèle)...")
+    fetched = asyncio.run(fetch_and_clean_all(pages, timeout=timeout, concurrency=concurrency,
+                                            verbose=verbose))
+    fetched = [success and html_path.exists() for (_, html_path), success in zip(pages, fetched)]
+    
+    # 2. Analyser les HTML nettoyés : CPU-bound, un processus par cœur (seul le chemin est transmis)
+    workers = jobs or os.cpu_count() or 1
+    use_pool = workers > 1 and sum(fetched) > 1
+    with (ProcessPoolExecutor(max_workers=workers) if use_pool else nullcontext()) as pool:
+        futures = {}
+        if pool is not None:
+            futures = {
+                i: pool.submit(analyze_html, str(html_path), url)
+                for i, ((url, html_path), success) in enumerate(zip(pages, fetched), 1) if success
+            }
+        
+        # Résultats récupérés dans l'ordre des URLs
+        for i, ((url, html_path), success) in enumerate(zip(pages, fetched), 1):
+            logging.info(f"[{i}/{len(urls)}] Traitement de {url}")
             
-            if not success or not html_path.exists():
-                raise Exception("Échec du téléchargement/nettoyage")
-            
-            # 2. Analyser le HTML nettoyé
-            logging.info(f"  → Analyse du contenu...")
-            data = analyze_html(str(html_path), url=url)
-            all_data.append(data)
-            logging.info(f"  ✓ Succès")
-            
-        except Exception as e:
-            logging.error(f"  ✗ Erreur: {e}")
-            all_data.append({
-                "URL": url,
-                "Title": f"ERREUR: {str(e)}",
-                "H1": "", "H2": "", "H3": "",
-                "Meta description": "", "Ancres internes": "",
-                "Mots-clés dominants": "", "N-grams": "",
-                "Fréquences": "", "Liens internes": "",
-                "Phrases phares": "", "Extrait de texte principal": ""
-            })
+            try:
+                if not success:
+                    raise Exception("Échec du téléchargement/nettoyage")
+                
+                logging.info(f"  → Analyse du contenu...")
+                if pool is not None:
+                    data = futures[i].result()
+                else:
+                    data = analyze_html(str(html_path), url=url)
+                all_data.append(data)
+                logging.info(f"  ✓ Succès")
+                
+            except Exception as e:
+                logging.error(f"  ✗ Erreur: {e}")
+                all_data.append({
+                    "URL": url,
+                    "Title": f"ERREUR: {str(e)}",
+                    "H1": "", "H2": "", "H3": "",
+                    "Meta description": "", "Ancres internes": "",
+                    "Mots-clés dominants": "", "N-grams": "",
+                    "Fréquences": "", "Liens internes": "",
+                    "Phrases phares": "", "Extrait de texte principal": ""
+                })
     
     if not all_data:
         logging.warning("Aucune donnée à exporter")
@@ -715,17 +783,17 @@ def process_urls(urls, temp_dir, output_dir, timeout=10, verbose=False, generate
         "Liens internes", "Phrases phares", "Extrait de texte principal"
     ]
     
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        for data in all_data:
-            writer.writerow(data)
+        writer.writerows(all_data)
     
     logging.info(f"CSV complet généré: {csv_path} ({len(all_data)} pages)")
     
     # 4. Agrégation globale
     logging.info("Agrégation des mots-clés globaux...")
-    aggregated = aggregate_keywords(all_data)
+    parsed_pages = [parse_page(data) for data in all_data]
+    aggregated = aggregate_keywords(all_data, parsed_pages)
     
     # 4b. Agrégation des phrases phares globales
     logging.info("Agrégation des phrases phares globales...")
@@ -741,34 +809,41 @@ def process_urls(urls, temp_dir, output_dir, timeout=10, verbose=False, generate
     
     # 6. Générer les visualisations
     logging.info("Génération des visualisations...")
-    generate_visualizations(all_data, aggregated, output_path, global_phrases)
+    generate_visualizations(all_data, aggregated, output_path, global_phrases, parsed_pages)
     
     # 7. Générer le PDF si demandé
     if generate_pdf:
-        data_global = read_aggregated_csv(agg_csv_path)
-        generate_pdf_report(all_data, aggregated, output_path, data_global, global_phrases)
+        generate_pdf_report(all_data, aggregated, output_path, global_phrases)
     
     # 8. Créer un fichier récapitulatif
     summary_path = output_path / "log.txt"
+    lines = [
+        f"Analyse générée le {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "=" * 60,
+        "",
+        f"Nombre d'URLs analysées: {len(urls)}",
+        f"Nombre de pages traitées avec succès: {len(all_data)}",
+        "",
+        "Fichiers générés:",
+        "  - analyse_complete.csv   : Données complètes pour toutes les pages",
+        "  - analyse_globale.csv    : Top 50 des mots-clés agrégés",
+        "  - phrases_globales.csv   : Top 50 des phrases phares agrégées",
+        "  - log.txt                : Ce fichier (récapitulatif de l'analyse)",
+    ]
+    if generate_pdf:
+        lines.append("  - rapport_analyse.pdf    : Rapport PDF complet")
+    lines += [
+        "  - visualisations/        : Graphiques PNG",
+        "      • top20_global.png   : Graphique en barres des top 20 mots-clés",
+        "      • top_phrases_globales.png   : Graphique des top 15 phrases phares",
+        "      • distribution_liens.png   : Histogramme de distribution des liens",
+        "      • wordcloud.png      : Nuage de mots",
+        "      • reseau_semantique.png   : Réseau de co-occurrences",
+        "      • heatmap_keywords_pages.png   : Présence des mots-clés par page",
+    ]
+    # une seule écriture pour tout le récapitulatif
     with open(summary_path, 'w', encoding='utf-8') as f:
-        f.write(f"Analyse générée le {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"=" * 60 + "\n\n")
-        f.write(f"Nombre d'URLs analysées: {len(urls)}\n")
-        f.write(f"Nombre de pages traitées avec succès: {len(all_data)}\n\n")
-        f.write(f"Fichiers générés:\n")
-        f.write(f"  - analyse_complete.csv   : Données complètes pour toutes les pages\n")
-        f.write(f"  - analyse_globale.csv    : Top 50 des mots-clés agrégés\n")
-        f.write(f"  - phrases_globales.csv   : Top 50 des phrases phares agrégées\n")
-        f.write(f"  - log.txt                : Ce fichier (récapitulatif de l'analyse)\n")
-        if generate_pdf:
-            f.write(f"  - rapport_analyse.pdf    : Rapport PDF complet\n")
-        f.write(f"  - visualisations/        : Graphiques PNG\n")
-        f.write(f"      • top20_global.png   : Graphique en barres des top 20 mots-clés\n")
-        f.write(f"      • top_phrases_globales.png   : Graphique des top 15 phrases phares\n")
-        f.write(f"      • distribution_liens.png   : Histogramme de distribution des liens\n")
-        f.write(f"      • wordcloud.png      : Nuage de mots\n")
-        f.write(f"      • reseau_semantique.png   : Réseau de co-occurrences\n")
-        f.write(f"      • heatmap_keywords_pages.png   : Présence des mots-clés par page\n")
+        f.write("\n".join(lines) + "\n")
     
     print(f"\n{'='*60}")
     print(f"✓ Analyse terminée avec succès!")
@@ -825,11 +900,13 @@ def aggregate_phrases(all_data, top_n=30):
 
 def save_global_phrases_csv(scored_phrases, output_path):
     """Sauvegarde les phrases phares agrégées dans un CSV."""
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(['Rang', 'Phrase phare', 'Fréquence', 'Longueur (mots)', 'Score'])
-        for i, (phrase, freq, length, score) in enumerate(scored_phrases, 1):
-            writer.writerow([i, phrase, freq, length, f"{score:.2f}"])
+        writer.writerows(
+            (i, phrase, freq, length, f"{score:.2f}")
+            for i, (phrase, freq, length, score) in enumerate(scored_phrases, 1)
+        )
     
     logging.info(f"CSV des phrases phares globales sauvegardé: {output_path}")
 
@@ -849,6 +926,10 @@ def main():
                         help='Ne pas générer le rapport PDF')
     parser.add_argument('--timeout', type=int, default=10, 
                         help='Timeout HTTP en secondes (défaut: 10)')
+    parser.add_argument('-c', '--concurrency', type=int, default=16,
+                        help='Nombre de téléchargements simultanés (défaut: 16)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="Nombre de processus pour l'analyse des pages (défaut: nombre de CPU)")
     parser.add_argument('-v', '--verbose', action='store_true', help='Mode verbeux')
     
     args = parser.parse_args()
@@ -857,6 +938,8 @@ def main():
         level=logging.DEBUG if args.verbose else logging.INFO,
         format="%(levelname)s: %(message)s"
     )
+    # httpx journalise chaque requête en INFO ("HTTP Request: GET ...") : seulement en mode verbeux
+    logging.getLogger("httpx").setLevel(logging.INFO if args.verbose else logging.WARNING)
     
     # Lire les URLs
     if not os.path.exists(args.list):
@@ -870,6 +953,8 @@ def main():
     
     logging.info(f"{len(urls)} URL(s) à traiter")
     
+    ensure_nltk_resources()
+    
     # Traiter toutes les URLs
     try:
         process_urls(
@@ -878,7 +963,9 @@ def main():
             output_dir=args.output_dir,
             timeout=args.timeout,
             verbose=args.verbose,
-            generate_pdf=not args.no_pdf
+            generate_pdf=not args.no_pdf,
+            concurrency=max(1, args.concurrency),
+            jobs=args.jobs
         )
     finally:
         # Nettoyer les fichiers temporaires si demandé
@@ -16,16 +16,16 @@ import os
 import sys
 import argparse
 import logging
-import csv
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlparse
 
 try:
     from reportlab.lib.pagesizes import letter, A4
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch, cm
     from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY, TA_RIGHT
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image, KeepTogether
     from reportlab.lib import colors
     from reportlab.pdfgen import canvas
     import pandas as pd
@@ -35,6 +35,45 @@ except ImportError:
     print("Erreur: reportlab n'est pas installé. Installez-le avec: pip install reportlab")
     sys.exit(1)
 
+# styles de tableaux construits une seule fois et partagés par toutes les tables
+URL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e75b6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f0f0')),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
+])
+
+PAGE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e75b6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f0f0')),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
+])
+
+GLOBAL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e75b6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (2, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f0f0')),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
+])
+
 
 def setup_logger(verbose=False):
     """Configure le logging."""
@@ -46,19 +85,32 @@ def setup_logger(verbose=False):
 
 
 def read_analysis_csv(csv_path):
-    """Lit le CSV d'analyse complète."""
-    df = pd.read_csv(csv_path)
+    """Lit le CSV d'analyse complète (toutes les colonnes sont du texte : pas d'inférence de type)."""
+    df = pd.read_csv(csv_path, dtype=str)
     return df
 
 
-def read_aggregated_csv(csv_path):
-    """Lit le CSV d'agrégation globale."""
-    data = []
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            data.append(row)
-    return data
+def truncated_column(df, col, width, default='N/A'):
+    """Colonne `col` en chaînes tronquées à `width` caractères (vectorisé), `default` si absente ou vide."""
+    if col not in df:
+        return [default] * len(df)
+    return df[col].fillna(default).astype(str).str.slice(0, width).to_numpy()
+
+
+def count_links_column(df, col='Liens internes'):
+    """Nombre de liens non vides par ligne dans une colonne 'a | b | c' (vectorisé)."""
+    if col not in df:
+        return [0] * len(df)
+    return df[col].fillna('').astype(str).str.count(r'[^|]*[^|\s][^|]*').to_numpy()
+
+
+def read_aggregated_csv(csv_path, nrows=50):
+    """Lit les `nrows` premières lignes du CSV d'agrégation globale (liste de dicts).
+    keep_default_na=False : un n-gram comme "nan" ou "null" reste une chaîne.
+    """
+    df = pd.read_csv(csv_path, nrows=nrows, keep_default_na=False,
+                     dtype={'Rang': 'int32', 'Mot-clé / N-gram': str, 'Occurrences': 'int32'})
+    return df.to_dict('records')
 
 
 def create_pdf_report(analysis_dir, output_pdf):
@@ -85,13 +137,16 @@ def create_pdf_report(analysis_dir, output_pdf):
     data_global = read_aggregated_csv(csv_global)
     
     # Créer le document PDF
+    # pageCompression explicite : les flux de page restent compressés en mémoire et sur disque
+    # même si la configuration locale de reportlab (rl_config) la désactive
     doc = SimpleDocTemplate(
         output_pdf,
         pagesize=A4,
         rightMargin=0.75*inch,
         leftMargin=0.75*inch,
         topMargin=1*inch,
-        bottomMargin=0.75*inch
+        bottomMargin=0.75*inch,
+        pageCompression=1
     )
     
     # Styles personnalisés
@@ -154,26 +209,18 @@ def create_pdf_report(analysis_dir, output_pdf):
     url_data = [['#', 'Domaine', 'URL']]
     
     for i, url in enumerate(urls, 1):
-        if pd.notna(url) and str(url) != 'ERREUR':
-            from urllib.parse import urlparse
-            parsed = urlparse(str(url))
-            domain = parsed.netloc or 'N/A'
-            unique_domains.add(domain)
-            url_data.append([str(i), domain, str(url)[:60] + ('...' if len(str(url)) > 60 else '')])
+        if pd.isna(url):
+            continue
+        url = str(url)
+        if url == 'ERREUR':
+            continue
+        domain = urlparse(url).netloc or 'N/A'
+        unique_domains.add(domain)
+        url_data.append([str(i), domain, url if len(url) <= 60 else url[:60] + '...'])
     
     if len(url_data) > 1:
         url_table = Table(url_data, colWidths=[0.5*inch, 1.5*inch, 3*inch])
-        url_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e75b6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f0f0')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-        ]))
+        url_table.setStyle(URL_TABLE_STYLE)
         content.append(url_table)
     
     content.append(Spacer(1, 0.3*inch))
@@ -186,46 +233,42 @@ def create_pdf_report(analysis_dir, output_pdf):
     content.append(Paragraph("Analyses Unitaires par Page", heading_style))
     content.append(Spacer(1, 0.2*inch))
     
-    for idx, row in df_complete.iterrows():
-        url = row.get('URL', f'Page {idx+1}')
-        
-        if str(url).startswith('ERREUR'):
-            continue
+    # cellules tronquées calculées une fois par colonne plutôt qu'une fois par ligne
+    page_fields = [('Title', 'Title'), ('H1', 'H1'), ('H2', 'H2'), ('H3', 'H3'),
+                   ('Meta Description', 'Meta description'), ('Mots-clés dominants', 'Mots-clés dominants')]
+    page_columns = {col: truncated_column(df_complete, col, 70) for _, col in page_fields}
+    links_counts = count_links_column(df_complete)
+
+    # la colonne URL existe toujours (utilisée plus haut) : pas de Series reconstruite par ligne ;
+    # les lignes en erreur sont écartées d'un coup par un masque, idx reste la position d'origine
+    page_urls = df_complete['URL'].to_numpy()
+    error_rows = df_complete['URL'].str.startswith('ERREUR', na=False).to_numpy()
+    for idx in (~error_rows).nonzero()[0]:
+        url = page_urls[idx]
         
         # Titre de la page
         page_title = str(url).split('/')[-1] or str(url)[:50]
-        content.append(Paragraph(f"Page {idx+1}: {page_title}", styles['Heading3']))
         
         # Tableau des données
-        page_data = [
-            ['Propriété', 'Contenu'],
-            ['URL', str(url)[:70]],
-            ['Title', str(row.get('Title', 'N/A'))[:70]],
-            ['H1', str(row.get('H1', 'N/A'))[:70]],
-            ['H2', str(row.get('H2', 'N/A'))[:70]],
-            ['H3', str(row.get('H3', 'N/A'))[:70]],
-            ['Meta Description', str(row.get('Meta description', 'N/A'))[:70]],
-            ['Mots-clés dominants', str(row.get('Mots-clés dominants', 'N/A'))[:70]],
-            ['Liens internes', str(len([l for l in str(row.get('Liens internes', '')).split('|') if l.strip()]))],
-        ]
+        page_data = [['Propriété', 'Contenu'], ['URL', str(url)[:70]]]
+        page_data += [[label, page_columns[col][idx]] for label, col in page_fields]
+        page_data.append(['Liens internes', str(links_counts[idx])])
         
         page_table = Table(page_data, colWidths=[1.5*inch, 4*inch])
-        page_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e75b6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f0f0')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
+        page_table.setStyle(PAGE_TABLE_STYLE)
+        # titre + tableau gardés ensemble ; ReportLab place autant de pages que possible par feuille
+        content.append(KeepTogether([
+            Paragraph(f"Page {idx+1}: {page_title}", styles['Heading3']),
+            page_table,
+            Spacer(1, 0.2*inch),
         ]))
-        content.append(page_table)
-        content.append(Spacer(1, 0.2*inch))
-        
-        if (idx + 1) % 3 == 0:
-            content.append(PageBreak())
+    
+    # le DataFrame et les tableaux qui en dérivent ne sont plus lus (seuls les
+    # comptes servent à la conclusion) : ils sont libérés avant doc.build
+    # plutôt qu'au retour de la fonction
+    n_pages = len(df_complete)
+    n_urls = len(urls)
+    del df_complete, page_columns, links_counts, page_urls, error_rows, urls
     
     content.append(PageBreak())
     
@@ -243,19 +286,7 @@ def create_pdf_report(analysis_dir, output_pdf):
         ])
     
     global_table = Table(global_data, colWidths=[0.7*inch, 3.5*inch, 1.3*inch])
-    global_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e75b6')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-        ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f0f0')),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-    ]))
+    global_table.setStyle(GLOBAL_TABLE_STYLE)
     content.append(global_table)
     
     content.append(PageBreak())
@@ -278,7 +309,8 @@ def create_pdf_report(analysis_dir, output_pdf):
             if viz_path.exists():
                 content.append(Paragraph(title, styles['Heading3']))
                 try:
-                    img = Image(str(viz_path), width=6.5*inch, height=4*inch)
+                    # lazy=2 : le PNG n'est ouvert qu'au dessin de sa page puis relâché
+                    img = Image(str(viz_path), width=6.5*inch, height=4*inch, lazy=2)
                     content.append(img)
                     content.append(Spacer(1, 0.2*inch))
                     content.append(PageBreak())
@@ -292,8 +324,8 @@ def create_pdf_report(analysis_dir, output_pdf):
     conclusion_text = f"""
     <b>Résumé de l'analyse:</b><br/><br/>
     
-    Cette analyse sémantique a examiné <b>{len(urls)} URL(s)</b> réparties sur <b>{len(unique_domains)} domaine(s)</b>.
-    Au total, <b>{len(df_complete)} page(s)</b> ont été analysées avec succès.<br/><br/>
+    Cette analyse sémantique a examiné <b>{n_urls} URL(s)</b> réparties sur <b>{len(unique_domains)} domaine(s)</b>.
+    Au total, <b>{n_pages} page(s)</b> ont été analysées avec succès.<br/><br/>
     
     <b>Principaux enseignements:</b><br/>
     • Le terme le plus fréquent est <b>"{data_global[0]['Mot-clé / N-gram']}"</b> avec 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 batch_clean.py
-Lit un fichier contenant une URL par ligne et exécute `clean_html.py` pour chacune.
+Lit un fichier contenant une URL par ligne et nettoie chacune avec `clean_html.process_url`.
 Usage:
   python3 batch_clean.py --list urls.txt [--out-dir /path] [--concurrency 4] [--delay 0.5] [--verbose]
 
@@ -12,17 +12,19 @@ Options:
   --delay / -D      : délai (secondes) entre lancements (utile en séquentiel ou pour limiter charge)
   --verbose / -v    : mode verbeux
 
-Le script invoque `clean_html.py` avec le même interpréteur Python que celui qui lance ce script.
+Le module `clean_html` (même dossier) est importé une seule fois et appelé en direct dans le processus,
+sans lancer un interpréteur Python par URL.
 """
 
 from pathlib import Path
 import argparse
 import sys
-import subprocess
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
 import time
 
+import clean_html
+
 
 def read_urls(file_path: Path):
     lines = file_path.read_text(encoding='utf-8', errors='replace').splitlines()
@@ -53,20 +55,12 @@ def make_output_for_url(out_dir: Path, url: str) -> Path:
     return candidate
 
 
-def run_one(clean_script: Path, python_exe: str, url: str, out_path: Path | None, verbose: bool):
-    cmd = [python_exe, str(clean_script), '--url', url]
-    if out_path:
-        cmd += ['--output', str(out_path)]
-    if verbose:
-        print('Running:', ' '.join(cmd))
+def run_one(url: str, out_path: Path | None, verbose: bool):
     try:
-        r = subprocess.run(cmd, capture_output=not verbose, text=True)
+        ok, err = clean_html.process_url(url, out_path, verbose=verbose)
     except Exception as e:
-        return (url, False, f'Failed to start process: {e}')
-    if r.returncode != 0:
-        out = r.stderr if not verbose else ''
-        return (url, False, out or f'Exit {r.returncode}')
-    return (url, True, '')
+        return (url, False, f'Unexpected error: {e}')
+    return (url, ok, err)
 
 
 def main():
@@ -88,13 +82,6 @@ def main():
         print('Aucune URL valide trouvée dans la liste.', file=sys.stderr)
         sys.exit(0)
 
-    clean_script = Path(__file__).resolve().parent / 'clean_html.py'
-    if not clean_script.exists():
-        print(f"clean_html.py introuvable dans le même dossier que ce script: {clean_script}", file=sys.stderr)
-        sys.exit(2)
-
-    python_exe = sys.executable
-
     out_dir = Path(args.out_dir).resolve() if args.out_dir else None
     if out_dir and not out_dir.exists():
         out_dir.mkdir(parents=True, exist_ok=True)
@@ -106,7 +93,7 @@ def main():
             target = make_output_for_url(out_dir, url)
             if args.verbose:
                 print(f'Processing {url} -> {target or "(default)"}')
-            res = run_one(clean_script, python_exe, url, target, args.verbose)
+            res = run_one(url, target, args.verbose)
             results.append(res)
             if args.delay:
                 time.sleep(args.delay)
@@ -116,7 +103,7 @@ def main():
             future_to_url = {}
             for url in urls:
                 target = make_output_for_url(out_dir, url)
-                future = ex.submit(run_one, clean_script, python_exe, url, target, args.verbose)
+                future = ex.submit(run_one, url, target, args.verbose)
                 future_to_url[future] = url
                 if args.delay:
                     time.sleep(args.delay)
@@ -13,16 +13,38 @@ Options:
   --user-agent  : user-agent HTTP (défaut: simple UA)
   --keep-images : ne pas toucher aux balises <img> (par défaut elles sont conservées)
   --extract-css : si présent, extrait le contenu de <style> dans un fichier .css à côté du output
+  --legacy-parser : nettoyage avec BeautifulSoup même si selectolax (plus rapide) est installé
   --verbose     : mode verbeux
 
-Le script nécessite les paquets Python : beautifulsoup4, requests
+Le script nécessite les paquets Python : beautifulsoup4, requests (selectolax ou lxml recommandés)
 """
 
 from pathlib import Path
 import argparse
 import sys
+from functools import lru_cache
 from bs4 import BeautifulSoup, Comment
 
+# lxml (optionnel) : parseur C pour bs4, nettement plus rapide que html.parser
+try:
+    import lxml  # noqa: F401
+    _BS4_PARSER = 'lxml'
+except ImportError:
+    _BS4_PARSER = 'html.parser'
+
+# selectolax (optionnel) : parseur HTML en C, nettoyage sans construire d'objets Python par nœud
+try:
+    try:
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    except ImportError:
+        # anciennes versions de selectolax : backend Modest uniquement
+        from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+DEFAULT_USER_AGENT = 'clean-html-bot/1.0 (+https://example.local)'
+
 
 def looks_like_stylesheet_link(tag):
     if tag.name != 'link':
@@ -41,100 +63,217 @@ def looks_like_stylesheet_link(tag):
     return False
 
 
-def clean_soup(soup, keep_images=False, extract_css_path=None, verbose=False):
-    # remove comments first
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        if verbose:
-            print("Removing comment")
-        comment.extract()
+# balises supprimées avec tout leur contenu (<style> est en plus collecté pour --extract-css)
+REMOVE_TAGS = frozenset(('script', 'iframe', 'embed', 'object', 'style'))
+# un <div> qui contient une de ces balises n'est jamais considéré comme vide
+EMBED_TAGS = frozenset(('img', 'iframe', 'embed', 'object'))
+
 
-    # Optionally extract inline <style> into a CSS file
+def clean_soup(soup, keep_images=False, extract_css_path=None, verbose=False):
+    # un seul parcours de l'arbre : les nœuds à retirer sont collectés puis supprimés
+    # après coup (on ne modifie pas l'arbre pendant qu'on le parcourt) ; les sous-arbres
+    # retirés ne sont pas visités
     css_accum = []
-    for name in ('script', 'iframe', 'embed', 'object'):
-        for tag in list(soup.find_all(name)):
+    to_remove = []
+    to_unwrap = []
+    stack = list(reversed(soup.contents))
+    while stack:
+        node = stack.pop()
+        if node.name is None:
+            # chaîne de texte : seuls les commentaires sont retirés
+            if isinstance(node, Comment):
+                if verbose:
+                    print("Removing comment")
+                to_remove.append(node)
+            continue
+        name = node.name
+        if name in REMOVE_TAGS:
             if verbose:
                 print(f"Removing <{name}> tag")
-            tag.decompose()
-    # handle <style>
-    for st in list(soup.find_all('style')):
-        text = st.string or ''
-        if extract_css_path and text.strip():
-            css_accum.append(text)
-        st.decompose()
-    # link tags that are stylesheets/imports
-    for tag in list(soup.find_all('link')):
-        if looks_like_stylesheet_link(tag):
+            if name == 'style':
+                # Optionally extract inline <style> into a CSS file
+                text = node.string or ''
+                if extract_css_path and text.strip():
+                    css_accum.append(text)
+            elif name == 'embed':
+                # libxml2 ne connaît pas <embed> comme balise vide : avec lxml il "avale"
+                # les éléments qui le suivent, on ne retire donc que la balise elle-même
+                to_unwrap.append(node)
+                stack.extend(reversed(node.contents))
+                continue
+            to_remove.append(node)
+            continue
+        # link tags that are stylesheets/imports
+        if name == 'link' and looks_like_stylesheet_link(node):
             if verbose:
-                print("Removing <link> stylesheet/import", tag)
-            tag.decompose()
-    # remove meta refresh
-    for m in list(soup.find_all('meta')):
-        if m.get('http-equiv', '').lower() == 'refresh':
+                print("Removing <link> stylesheet/import", node)
+            to_remove.append(node)
+            continue
+        # remove meta refresh
+        if name == 'meta' and node.get('http-equiv', '').lower() == 'refresh':
             if verbose:
-                print("Removing meta refresh", m)
-            m.decompose()
-    # remove inline style attributes and event handlers
-    for tag in soup.find_all(True):
-        # skip images if user asked to keep them
-        if keep_images and tag.name == 'img':
-            # but still remove on* handlers from img
-            attrs = list(tag.attrs.keys())
-            for a in attrs:
-                if a.lower().startswith('on'):
-                    try:
-                        del tag.attrs[a]
-                    except KeyError:
-                        pass
+                print("Removing meta refresh", node)
+            to_remove.append(node)
             continue
-        if tag.has_attr('style'):
+        # remove inline style attributes and event handlers (les noms d'attributs sont
+        # déjà en minuscules via le parseur) ; on ne réassigne attrs que si besoin
+        tag = node
+        if keep_images and name == 'img':
+            # skip images if user asked to keep them, but still remove on* handlers
+            kept = {k: v for k, v in tag.attrs.items() if not k.startswith('on')}
+        else:
+            kept = {k: v for k, v in tag.attrs.items() if not k.startswith('on') and k != 'style'}
+        if len(kept) != len(tag.attrs):
             if verbose:
-                print(f"Removing style attr from <{tag.name}>")
-            del tag['style']
-        attrs = list(tag.attrs.keys())
-        for a in attrs:
-            if a.lower().startswith('on'):
+                for a in tag.attrs:
+                    if a not in kept:
+                        print(f"Removing attribute {a} from <{name}>")
+            tag.attrs = kept
+        stack.extend(reversed(tag.contents))
+
+    for tag in to_unwrap:
+        tag.unwrap()
+    for node in to_remove:
+        if isinstance(node, Comment):
+            node.extract()
+        else:
+            node.decompose()
+
+    # remove empty <div> elements (no text and no important children) : balises parcourues en
+    # ordre inverse du document (enfants avant parents), l'état de chaque balise est déduit de ses
+    # enfants directs une seule fois au lieu d'un get_text()/find() récursif par <div>
+    tags = soup.find_all(True)
+    if tags:
+        # mêmes types de chaînes que get_text() (texte et CDATA, pas les <template>)
+        text_types = tags[0].interesting_string_types
+        non_empty = set()  # id() des balises avec du texte visible ou un média
+        for tag in reversed(tags):
+            if tag.name in EMBED_TAGS or any(
+                    id(c) in non_empty if c.name else type(c) in text_types and c.strip()
+                    for c in tag.contents):
+                non_empty.add(id(tag))
+            elif tag.name == 'div':
+                # Otherwise it's empty (or only contained comments which are already removed) -> remove
                 if verbose:
-                    print(f"Removing event handler {a} from <{tag.name}>")
-                try:
-                    del tag.attrs[a]
-                except KeyError:
-                    pass
-
-    # remove empty <div> elements (no text and no important children)
-    for div in list(soup.find_all('div')):
-        # if there's visible text inside, keep
-        if div.get_text(strip=True):
+                    print("Removing empty <div>")
+                tag.decompose()
+
+    # return cleaned soup and css content (if any)
+    return soup, '\n\n'.join(css_accum) if css_accum else None
+
+
+# nom des nœuds commentaire selon le backend selectolax (Lexbor / Modest)
+_SX_COMMENT_TAGS = frozenset(('-comment', '_comment'))
+
+
+def _sx_looks_like_stylesheet_link(node):
+    """Équivalent de `looks_like_stylesheet_link` pour un nœud <link> selectolax."""
+    attrs = node.attributes
+    rel_text = (attrs.get('rel') or '').lower()
+    if 'stylesheet' in rel_text or 'import' in rel_text:
+        return True
+    if (attrs.get('href') or '').lower().endswith('.css'):
+        return True
+    return (attrs.get('as') or '').lower() == 'style'
+
+
+def clean_tree(tree, keep_images=False, extract_css_path=None, verbose=False):
+    """Équivalent de `clean_soup` sur un arbre selectolax ; retourne (arbre, css ou None)."""
+    css_accum = []
+    to_remove = []
+    for node in tree.root.traverse(include_text=True):
+        name = node.tag
+        if name in _SX_COMMENT_TAGS:
+            if verbose:
+                print("Removing comment")
+            to_remove.append(node)
+        elif name in REMOVE_TAGS:
+            if verbose:
+                print(f"Removing <{name}> tag")
+            # Optionally extract inline <style> into a CSS file (sauf s'il est dans un nœud retiré)
+            if name == 'style' and extract_css_path and not _sx_in_removed(node):
+                text = node.text(deep=True) or ''
+                if text.strip():
+                    css_accum.append(text)
+            to_remove.append(node)
+        elif name == 'link':
+            if _sx_looks_like_stylesheet_link(node):
+                if verbose:
+                    print("Removing <link> stylesheet/import", node.html)
+                to_remove.append(node)
+        elif name == 'meta' and (node.attributes.get('http-equiv') or '').lower() == 'refresh':
+            if verbose:
+                print("Removing meta refresh", node.html)
+            to_remove.append(node)
+        elif name != '-text':
+            # remove inline style attributes and event handlers (img garde son style si demandé)
+            keep_style = keep_images and name == 'img'
+            attrs = node.attrs
+            for a in [k for k in attrs if k.startswith('on') or (k == 'style' and not keep_style)]:
+                if verbose:
+                    print(f"Removing attribute {a} from <{name}>")
+                del attrs[a]
+
+    # ordre inverse du document : un nœud est toujours détruit avant ses ancêtres
+    for node in reversed(to_remove):
+        node.decompose()
+
+    # remove empty <div> elements (no text and no important children), des plus profonds aux
+    # plus hauts : un <div> ne contenant que des <div> vides est vide à son tour
+    for div in reversed(tree.css('div')):
+        if div.text(strip=True):
             continue
-        # if it contains images/embeds/objects/iframes, keep
-        if div.find(['img', 'iframe', 'embed', 'object']):
+        if div.css_first('img, iframe, embed, object') is not None:
             continue
-        # Otherwise it's empty (or only contained comments which are already removed) -> remove
         if verbose:
             print("Removing empty <div>")
         div.decompose()
 
-    # return cleaned soup and css content (if any)
-    return soup, '\n\n'.join(css_accum) if css_accum else None
+    return tree, '\n\n'.join(css_accum) if css_accum else None
 
 
-def fetch_url(url, timeout=10, user_agent=None):
+def _sx_in_removed(node):
+    """Vrai si le nœud selectolax est contenu dans une balise de `REMOVE_TAGS`."""
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in REMOVE_TAGS:
+            return True
+        parent = parent.parent
+    return False
+
+
+@lru_cache(maxsize=None)
+def _get_session():
+    """Session requests partagée par tous les appels (et threads) de fetch_url, créée au premier
+    appel : keep-alive et pool de connexions évitent un handshake TCP/TLS par URL d'un même hôte.
+    """
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def fetch_url(url, timeout=10, user_agent=None):
+    """Télécharge une URL et retourne le corps de la réponse en octets."""
     headers = {}
     if user_agent:
         headers['User-Agent'] = user_agent
     else:
-        headers['User-Agent'] = 'clean-html-bot/1.0 (+https://example.local)'
+        headers['User-Agent'] = DEFAULT_USER_AGENT
     try:
-        r = requests.get(url, headers=headers, timeout=timeout)
+        r = _get_session().get(url, headers=headers, timeout=timeout)
         r.raise_for_status()
     except Exception as e:
         raise RuntimeError(f"Erreur lors de la récupération de l'URL {url}: {e}")
-    # force decode as UTF-8 to ensure output is UTF-8
-    try:
-        text = r.content.decode('utf-8', errors='replace')
-    except Exception:
-        text = r.text
-    return text
+    # octets bruts : pas de copie str intermédiaire, le parseur décode lui-même (UTF-8
+    # avec remplacement pour selectolax, détection du charset pour bs4) ; la sortie reste
+    # écrite en UTF-8
+    return r.content
 
 
 def _strip_empty_lines(text: str) -> str:
@@ -147,6 +286,25 @@ def _strip_empty_lines(text: str) -> str:
     return '\n'.join(kept) + ('\n' if kept else '')
 
 
+def clean_html_text(html, keep_images=False, extract_css=False, verbose=False, legacy_parser=False):
+    """Nettoie un HTML (str ou bytes) et retourne (html nettoyé, css extrait ou None).
+    Les lignes vides sont retirées des deux textes ; utilisable en import depuis d'autres scripts.
+    selectolax est utilisé s'il est installé, BeautifulSoup sinon ou si `legacy_parser` est vrai.
+    """
+    if SELECTOLAX_AVAILABLE and not legacy_parser:
+        if not html.strip():
+            # selectolax produirait un squelette <html><head></head><body></body></html>
+            return '', None
+        tree, css_text = clean_tree(HTMLParser(html), keep_images=keep_images, extract_css_path=extract_css, verbose=verbose)
+        out_html = tree.html
+    else:
+        soup = BeautifulSoup(html, _BS4_PARSER)
+        cleaned_soup, css_text = clean_soup(soup, keep_images=keep_images, extract_css_path=extract_css, verbose=verbose)
+        out_html = str(cleaned_soup)
+    out_text = _strip_empty_lines(out_html)
+    return out_text, _strip_empty_lines(css_text) if css_text else None
+
+
 def _default_output_path(args) -> Path:
     """Compute default output path according to rules:
     - default folder is same as this script
@@ -161,8 +319,14 @@ def _default_output_path(args) -> Path:
         filename = f"{stem}_clean{suffix}"
         return script_dir / filename
     # else URL
+    return _default_output_for_url(args.url)
+
+
+def _default_output_for_url(url) -> Path:
+    """Default output path for a URL: domain name.html in the script folder, with _1, _2, ... if taken."""
+    script_dir = Path(__file__).resolve().parent
     from urllib.parse import urlparse
-    parsed = urlparse(args.url)
+    parsed = urlparse(url)
     host = parsed.hostname or 'output'
     base = host
     suffix = '.html'
@@ -174,6 +338,39 @@ def _default_output_path(args) -> Path:
     return candidate
 
 
+def write_outputs(outp, out_text, css_text=None, verbose=False):
+    """Écrit le HTML nettoyé (et le CSS extrait s'il y en a) en UTF-8."""
+    # force UTF-8 and replace invalid chars
+    outp.write_text(out_text, encoding='utf-8', errors='replace')
+    if verbose:
+        print(f"Fichier nettoyé écrit dans : {outp}")
+
+    # write css file if requested
+    if css_text:
+        css_path = outp.with_suffix(outp.suffix + '.extracted.css')
+        css_path.write_text(css_text, encoding='utf-8', errors='replace')
+        if verbose:
+            print(f"CSS inline extrait vers : {css_path}")
+
+
+def process_url(url, out_path=None, timeout=10, user_agent=None, keep_images=False, extract_css=False, verbose=False,
+                legacy_parser=False):
+    """Récupère, nettoie et écrit une URL ; retourne (ok, message d'erreur).
+    Point d'entrée en import (batch_clean) : aucune exception ni sys.exit ne remonte.
+    """
+    try:
+        outp = Path(out_path) if out_path else _default_output_for_url(url)
+        if verbose:
+            print(f"Fetching URL: {url}")
+        html = fetch_url(url, timeout=timeout, user_agent=user_agent)
+        out_text, css_text = clean_html_text(html, keep_images=keep_images, extract_css=extract_css, verbose=verbose,
+                                             legacy_parser=legacy_parser)
+        write_outputs(outp, out_text, css_text if extract_css else None, verbose=verbose)
+    except Exception as e:
+        return False, str(e)
+    return True, ''
+
+
 def main():
     p = argparse.ArgumentParser(description='Nettoie un fichier HTML (local ou URL)')
     p.add_argument('-i', '--input', help='Fichier HTML source (local)')
@@ -183,6 +380,7 @@ def main():
     p.add_argument('--user-agent', default=None, help='User-Agent HTTP à utiliser lors du fetch')
     p.add_argument('--keep-images', action='store_true', help='Ne pas supprimer les balises <img> (par défaut elles sont conservées)')
     p.add_argument('--extract-css', action='store_true', help='Extraire les <style> inline dans un fichier .css à côté de la sortie')
+    p.add_argument('--legacy-parser', action='store_true', help='Nettoyer avec BeautifulSoup même si selectolax est installé')
     p.add_argument('--verbose', action='store_true')
     args = p.parse_args()
 
@@ -209,24 +407,10 @@ def main():
             sys.exit(2)
         html = inp.read_text(encoding='utf-8', errors='replace')
 
-    # parse
-    soup = BeautifulSoup(html, 'html.parser')
-    cleaned_soup, css_text = clean_soup(soup, keep_images=args.keep_images, extract_css_path=args.extract_css, verbose=args.verbose)
-
-    # prepare output text, remove empty lines, force UTF-8 and replace invalid chars
-    out_text = str(cleaned_soup)
-    out_text = _strip_empty_lines(out_text)
-    outp.write_text(out_text, encoding='utf-8', errors='replace')
-    if args.verbose:
-        print(f"Fichier nettoyé écrit dans : {outp}")
-
-    # write css file if requested
-    if args.extract_css and css_text:
-        css_path = outp.with_suffix(outp.suffix + '.extracted.css')
-        css_text = _strip_empty_lines(css_text)
-        css_path.write_text(css_text, encoding='utf-8', errors='replace')
-        if args.verbose:
-            print(f"CSS inline extrait vers : {css_path}")
+    # parse + clean, remove empty lines
+    out_text, css_text = clean_html_text(html, keep_images=args.keep_images, extract_css=args.extract_css, verbose=args.verbose,
+                                         legacy_parser=args.legacy_parser)
+    write_outputs(outp, out_text, css_text if args.extract_css else None, verbose=args.verbose)
 
 
 if __name__ == '__main__':
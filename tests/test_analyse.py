@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import analyse_structure_html as ash  # noqa: E402
+
+
+XHTML = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>Thé vert</title></head>'
+    "<body><h1>Été</h1><p>Un terrarium tropical pour reptiles.</p></body></html>\n"
+)
+
+
+@pytest.mark.skipif(not ash.LXML_AVAILABLE, reason="lxml non installé")
+@pytest.mark.parametrize("fast_text", [False, True])
+def test_lxml_xhtml_declaration(tmp_path, monkeypatch, fast_text):
+    # page XHTML avec déclaration <?xml encoding=...?> : le parseur lxml ne doit pas échouer
+    path = tmp_path / "page.html"
+    path.write_text(XHTML, encoding="utf-8")
+    monkeypatch.setattr(ash, "SELECTOLAX_AVAILABLE", False)
+
+    row = ash.analyze_html(str(path), fast_text=fast_text)
+
+    assert row["Title"] == "Thé vert"
+    assert row["H1"] == "Été"
+    assert "terrarium" in row["Mots-clés dominants"].split(" | ")